@@ -8,21 +8,17 @@
 
 import streamlit as st
 import pandas as pd
-import io
-import os
+import functools
 import sys
+import time
+import uuid
 from datetime import datetime
-import zipfile
-from contextlib import redirect_stdout
 
 # Import all features
 from config import Config
-from feature1 import Feature1
-from feature2 import Feature2
-from feature3 import Feature3
-from feature4 import Feature4
-from feature5 import Feature5
-from feature6 import Feature6
+from jobs import job_runner
+from output_bundle import build_zip_bundle
+from pipeline import PIPELINE_STAGES, process_excel_file
 
 # Page configuration
 st.set_page_config(
@@ -112,6 +108,30 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+
+def show_download_buttons(files, key_prefix, first_index=0):
+    """
+    Render one download button per generated file, three per row
+    
+    Args:
+        files: Feature 6 results to offer
+        key_prefix: Widget key prefix, unique per section
+        first_index: Position of files[0] in the whole run (keeps keys stable)
+    """
+    cols = st.columns(min(len(files), 3))
+    
+    for idx, file_info in enumerate(files, start=first_index):
+        with cols[(idx - first_index) % 3]:
+            # Served straight from the rendered bytes, no disk round trip
+            st.download_button(
+                label=f"📄 {file_info['variable_name']}",
+                data=file_info['content'],
+                file_name=file_info['file_name'],
+                mime="text/plain",
+                key=f"{key_prefix}_{idx}"
+            )
+
+
 # Header
 st.markdown('<div class="brand-name">MASTEC</div>', unsafe_allow_html=True)
 st.markdown('<div class="main-header">📡 DSS VALUE Extractor Tool</div>', unsafe_allow_html=True)
@@ -120,102 +140,23 @@ st.markdown('<div class="sub-header">Automate template filling for DSS </div>',
 # Initialize session state
 if 'processed' not in st.session_state:
     st.session_state.processed = False
-if 'log_messages' not in st.session_state:
-    st.session_state.log_messages = []
+if 'run_log' not in st.session_state:
+    st.session_state.run_log = None
+if 'log_download' not in st.session_state:
+    st.session_state.log_download = None
 if 'generated_files' not in st.session_state:
     st.session_state.generated_files = []
-
-class StreamCapture:
-    """Capture print statements to display in log window"""
-    def __init__(self):
-        self.logs = []
-    
-    def write(self, text):
-        if text.strip():
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            self.logs.append(f"[{timestamp}] {text.strip()}")
-            st.session_state.log_messages.append(f"[{timestamp}] {text.strip()}")
-    
-    def flush(self):
-        pass
-
-def process_excel_file(uploaded_file):
-    """Process the uploaded Excel file through all features"""
-    
-    try:
-        # Save uploaded file temporarily
-        temp_file_path = "temp_upload.xlsx"
-        with open(temp_file_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
-        
-        # Initialize config
-        config = Config()
-        config.excel_file_path = temp_file_path
-        
-        # Capture all print outputs
-        stream_capture = StreamCapture()
-        
-        with redirect_stdout(stream_capture):
-            # Feature 1: DSS Extraction
-            print("🔵 FEATURE 1: DSS Value Extraction")
-            feature1 = Feature1(config)
-            filtered_df = feature1.execute()
-            
-            if filtered_df is None or len(filtered_df) == 0:
-                print("⚠️ No DSS values found")
-                return None
-            
-            print(f"✅ Feature 1 Complete")
-            print("")
-            
-            # Feature 2: NRCellDU Grouping
-            print("🔵 FEATURE 2: NRCellDU Grouping")
-            feature2 = Feature2(config, filtered_df)
-            dss_variables = feature2.execute()
-            print(f"✅ Feature 2 Complete")
-            print("")
-            
-            # Feature 3: JSON Cleaning
-            print("🔵 FEATURE 3: JSON Cleaning")
-            feature3 = Feature3(config, dss_variables)
-            cleaned_variables = feature3.execute()
-            print(f"✅ Feature 3 Complete")
-            print("")
-            
-            # Feature 4: JSON Population
-            print("🔵 FEATURE 4: Data Population")
-            feature4 = Feature4(config, cleaned_variables)
-            populated_variables = feature4.execute()
-            print(f"✅ Feature 4 Complete")
-            print("")
-            
-            # Feature 5: Placeholder Mapping
-            print("🔵 FEATURE 5: Placeholder Mapping")
-            feature5 = Feature5(config, populated_variables)
-            mapped_variables = feature5.execute()
-            print(f"✅ Feature 5 Complete")
-            print("")
-            
-            # Feature 6: Template Generation
-            print("🔵 FEATURE 6: Template Generation")
-            feature6 = Feature6(config, mapped_variables)
-            generated_files = feature6.execute()
-            print(f"✅ Feature 6 Complete")
-            print("")
-            
-            print("🎉 All processing complete!")
-        
-        # Clean up
-        if os.path.exists(temp_file_path):
-            os.remove(temp_file_path)
-        
-        return generated_files
-        
-    except Exception as e:
-        print(f"❌ Error: {str(e)}")
-        import traceback
-        print(f"Details: {traceback.format_exc()}")
-        return None
+if 'run_id' not in st.session_state:
+    st.session_state.run_id = None
+if 'zip_bundle' not in st.session_state:
+    st.session_state.zip_bundle = None
+if 'stage_timings' not in st.session_state:
+    st.session_state.stage_timings = None
+if 'session_id' not in st.session_state:
+    st.session_state.session_id = uuid.uuid4().hex
+if 'job_id' not in st.session_state:
+    # A refreshed browser reconnects to its job through the URL
+    st.session_state.job_id = st.experimental_get_query_params().get('job', [None])[0]
 
 # Main content
 col1, col2 = st.columns([2, 1])
@@ -234,21 +175,32 @@ with col1:
         st.write(f"**Filename:** {uploaded_file.name}")
         st.write(f"**Size:** {uploaded_file.size / 1024:.2f} KB")
         
+        partition_by_site = st.checkbox(
+            "One file per site",
+            help="Group by gNB and band+carrier pattern instead of the pattern alone (market-scale workbooks)"
+        )
+        
         # Process button appears after upload
         if st.button("🚀 Start Processing", key="process_btn"):
-            st.session_state.log_messages = []
             st.session_state.processed = False
             st.session_state.generated_files = []
             
-            with st.spinner("⏳ Processing... Please wait..."):
-                generated_files = process_excel_file(uploaded_file)
-                
-                if generated_files and len(generated_files) > 0:
-                    st.session_state.generated_files = generated_files
-                    st.session_state.processed = True
-                    st.success("✅ Processing completed successfully!")
-                else:
-                    st.error("❌ Processing failed. Check the log for details.")
+            run_config = Config()
+            run_config.partition_by_site = partition_by_site
+            
+            # Run in the background; the page polls the job for progress
+            job = job_runner.submit(
+                functools.partial(process_excel_file, config=run_config),
+                uploaded_file.getvalue(),
+                uploaded_file.name,
+                st.session_state.session_id,
+                total_stages=len(PIPELINE_STAGES)
+            )
+            st.session_state.job_id = job.id
+            st.session_state.run_log = job.log
+            
+            # Keep the job in the URL so a refresh reconnects to it
+            st.experimental_set_query_params(job=job.id)
 
 with col2:
     st.markdown("### 📋 Instructions")
@@ -261,60 +213,125 @@ with col2:
     **Note:** Template files must be in the `templates/` folder on the server.
     """)
 
+# Background job progress / results
+job = job_runner.get(st.session_state.job_id)
+
+if job is not None:
+    st.session_state.run_log = job.log
+    
+    if not job.finished:
+        st.progress(job.fraction, text=f"⏳ {job.describe()}")
+        
+        # Speed comes from the per-file events, time left from the groups done
+        files_per_second = job.file_rate()
+        eta_seconds = job.eta_seconds()
+        if files_per_second is not None or eta_seconds is not None:
+            rate_text = f"⚡ {len(job.files)} file(s) ready"
+            if files_per_second is not None:
+                rate_text += f" · {files_per_second:.1f} files/s"
+            if eta_seconds is not None:
+                rate_text += f" · about {eta_seconds:.0f}s left"
+            st.caption(rate_text)
+        
+        # Files become downloadable as soon as they are rendered
+        ready_files = job.files[:]
+        if ready_files:
+            st.markdown("### 📥 Files Ready")
+            live_limit = Config().live_download_limit
+            if len(ready_files) > live_limit:
+                st.caption(f"Showing the newest {live_limit} of {len(ready_files)} files; all are available when the job finishes")
+            first_index = max(len(ready_files) - live_limit, 0)
+            show_download_buttons(ready_files[first_index:], "live", first_index)
+    elif job.id != st.session_state.run_id:
+        # First rerun after the job finished: publish its results once
+        st.session_state.run_id = job.id
+        st.session_state.stage_timings = job.timings
+        generated_files = job.result
+        
+        if job.status == "done" and generated_files and len(generated_files) > 0:
+            st.session_state.generated_files = generated_files
+            st.session_state.processed = True
+            st.session_state.run_timestamp = datetime.fromtimestamp(job.submitted_at).strftime('%Y%m%d_%H%M%S')
+            st.success("✅ Processing completed successfully!")
+        else:
+            st.error("❌ Processing failed. Check the log for details.")
+
 # Download section - ONLY NOTEPAD FILES
 if st.session_state.processed and st.session_state.generated_files:
     st.markdown("---")
     st.markdown("### 📥 Download Generated Files")
     
     # Individual file downloads
-    cols = st.columns(min(len(st.session_state.generated_files), 3))
-    
-    for idx, file_info in enumerate(st.session_state.generated_files):
-        col_idx = idx % 3
-        
-        with cols[col_idx]:
-            file_path = file_info['output_file']
-            
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    file_content = f.read()
-                
-                st.download_button(
-                    label=f"📄 {file_info['variable_name']}",
-                    data=file_content,
-                    file_name=os.path.basename(file_path),
-                    mime="text/plain",
-                    key=f"download_{idx}"
-                )
+    show_download_buttons(st.session_state.generated_files, "download")
     
     # Download all as ZIP
     if len(st.session_state.generated_files) > 1:
         st.markdown("---")
         
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            for file_info in st.session_state.generated_files:
-                file_path = file_info['output_file']
-                if os.path.exists(file_path):
-                    zip_file.write(file_path, os.path.basename(file_path))
-        
-        zip_buffer.seek(0)
+        # Build the archive once per processing run; reruns reuse it
+        bundle = st.session_state.zip_bundle
+        if bundle is None or bundle['run_id'] != st.session_state.run_id:
+            bundle = {
+                'run_id': st.session_state.run_id,
+                'data': build_zip_bundle(
+                    st.session_state.generated_files,
+                    Config().zip_compression_level
+                )
+            }
+            st.session_state.zip_bundle = bundle
         
         st.download_button(
             label="📦 Download All Files (ZIP)",
-            data=zip_buffer,
-            file_name=f"dss_output_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip",
+            data=bundle['data'],
+            file_name=f"dss_output_{st.session_state.run_timestamp}.zip",
             mime="application/zip",
             use_container_width=True
         )
 
+# Stage timings for the last run
+if st.session_state.processed and st.session_state.stage_timings is not None:
+    timings = st.session_state.stage_timings
+    
+    st.markdown("---")
+    st.markdown(f"### ⏱️ Stage Timings ({timings.total_seconds:.2f}s total)")
+    st.dataframe(pd.DataFrame(timings.table_rows()), use_container_width=True, hide_index=True)
+    
+    st.download_button(
+        label="⏱️ Download Timings (JSON)",
+        data=timings.to_json(),
+        file_name=f"stage_timings_{st.session_state.run_timestamp}.json",
+        mime="application/json",
+        key="download_timings"
+    )
+
 # Log window
 st.markdown("---")
 st.markdown("### 📊 Processing Log")
 
-if st.session_state.log_messages:
-    log_content = "\n".join(st.session_state.log_messages)
+run_log = st.session_state.run_log
+
+if run_log:
+    # Only the newest lines are rendered; the full log is a download
+    tail_lines = Config().log_tail_lines
+    log_content = "\n".join(run_log.tail(tail_lines))
+    if len(run_log) > tail_lines:
+        st.caption(f"Showing the last {tail_lines} of {len(run_log)} lines")
     st.markdown(f'<div class="log-box">{log_content}</div>', unsafe_allow_html=True)
+    
+    # Offer the complete log once the run has finished (read once per run)
+    if job is None or job.finished:
+        log_download = st.session_state.log_download
+        if log_download is None or log_download['log'] is not run_log:
+            log_download = {'log': run_log, 'data': run_log.read_all()}
+            st.session_state.log_download = log_download
+        
+        st.download_button(
+            label="📜 Download Full Log",
+            data=log_download['data'],
+            file_name=f"dss_log_{st.session_state.get('run_timestamp', 'run')}.txt",
+            mime="text/plain",
+            key="download_log"
+        )
 else:
     st.markdown('<div class="log-box">Waiting for file upload...</div>', unsafe_allow_html=True)
 
@@ -325,4 +342,7 @@ st.markdown(f'''
     </div>
 ''', unsafe_allow_html=True)
 
-
+# Keep polling while the background job is running
+if job is not None and not job.finished:
+    time.sleep(Config().job_poll_seconds)
+    st.rerun()
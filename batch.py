@@ -0,0 +1,268 @@
+#==============================================================================
+# BATCH PROCESSING
+#==============================================================================
+# Description: Command-line entry point that runs Feature 1 → Feature 6 on
+#              many workbooks in parallel, one output folder per workbook
+# Brand: MASTEC
+# Developer: AKSHATHA KALLUR
+#==============================================================================
+#
+# Usage:
+#     python batch.py markets/ --output-dir batch_output
+#     python batch.py "markets/*.xlsx" --workers 8
+#
+
+import argparse
+import contextlib
+import glob
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from config import Config
+from instrumentation import StageTimer
+from pipeline import run_pipeline
+
+WORKBOOK_EXTENSIONS = ('.xlsx', '.xls')
+
+
+def find_workbooks(inputs):
+    """
+    Expand directories and glob patterns into workbook paths
+    
+    Args:
+        inputs: Directories, glob patterns or file paths
+    
+    Returns:
+        list: Absolute workbook paths, sorted and de-duplicated
+    """
+    workbooks = set()
+    
+    for item in inputs:
+        if os.path.isdir(item):
+            candidates = [os.path.join(item, name) for name in os.listdir(item)]
+        else:
+            candidates = glob.glob(item)
+        
+        for path in candidates:
+            name = os.path.basename(path)
+            # Skip Excel lock files such as "~$market.xlsx"
+            if name.startswith('~$'):
+                continue
+            if os.path.isfile(path) and name.lower().endswith(WORKBOOK_EXTENSIONS):
+                workbooks.add(os.path.abspath(path))
+    
+    return sorted(workbooks)
+
+
+def assign_output_folders(workbooks, output_dir):
+    """
+    Give every workbook its own output folder named after the file
+    
+    Args:
+        workbooks: Workbook paths
+        output_dir: Parent folder for all outputs
+    
+    Returns:
+        dict: Workbook path → output folder
+    """
+    folders = {}
+    used_names = set()
+    
+    for path in workbooks:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        name = stem
+        suffix = 2
+        # Same file name in different input folders: keep both outputs
+        while name.lower() in used_names:
+            name = f"{stem}_{suffix}"
+            suffix += 1
+        used_names.add(name.lower())
+        folders[path] = os.path.join(output_dir, name)
+    
+    return folders
+
+
+def process_workbook(workbook_path, output_folder, verbose=False, by_site=False):
+    """
+    Run the pipeline on one workbook (executes in a worker process)
+    
+    The feature diagnostics go to run.log and the per-stage timings to
+    stage_timings.json inside the workbook's output folder.
+    
+    Args:
+        workbook_path: Workbook to process
+        output_folder: Folder receiving the generated files and run.log
+        verbose: Include per-row detail lines in run.log
+        by_site: One file per site and band+carrier pattern
+    
+    Returns:
+        dict: workbook, output_folder, files, seconds and error (None if OK)
+    """
+    start_time = time.perf_counter()
+    os.makedirs(output_folder, exist_ok=True)
+    
+    config = Config()
+    config.excel_file_path = workbook_path
+    config.output_folder = output_folder
+    config.write_output_files = True
+    config.verbose = verbose
+    config.partition_by_site = by_site
+    # Workbooks are already spread across processes; don't nest worker pools
+    config.parallel_sheet_loading = False
+    config.partition_workers = 1
+    
+    timer = StageTimer(track_memory=config.stage_memory_tracking)
+    
+    result = {
+        "workbook": workbook_path,
+        "output_folder": output_folder,
+        "files": 0,
+        "seconds": 0.0,
+        "error": None
+    }
+    
+    with open(os.path.join(output_folder, "run.log"), 'w', encoding='utf-8') as log_file:
+        with contextlib.redirect_stdout(log_file):
+            try:
+                generated_files = run_pipeline(config, timer=timer)
+                if generated_files is None:
+                    result["error"] = "No DSS values found"
+                else:
+                    result["files"] = len(generated_files)
+            except Exception as e:
+                result["error"] = str(e) or e.__class__.__name__
+                print(f"❌ Error: {str(e)}")
+                print(f"Details: {traceback.format_exc()}")
+    
+    with open(os.path.join(output_folder, config.stage_timings_file), 'w', encoding='utf-8') as f:
+        f.write(timer.to_json())
+    
+    result["seconds"] = time.perf_counter() - start_time
+    return result
+
+
+def print_summary(results, elapsed_seconds):
+    """Print throughput and failures for a finished batch"""
+    succeeded = [r for r in results if r["error"] is None]
+    failed = [r for r in results if r["error"] is not None]
+    total_files = sum(r["files"] for r in results)
+    
+    print()
+    print("=" * 80)
+    print("📊 BATCH SUMMARY")
+    print("=" * 80)
+    print(f"   Workbooks:       {len(results)} ({len(succeeded)} succeeded, {len(failed)} failed)")
+    print(f"   Files generated: {total_files}")
+    print(f"   Elapsed:         {elapsed_seconds:.2f}s")
+    if elapsed_seconds > 0:
+        print(f"   Throughput:      {len(results) / elapsed_seconds:.2f} workbooks/s, "
+              f"{total_files / elapsed_seconds:.2f} files/s")
+    
+    if failed:
+        print()
+        print("❌ Failures:")
+        for r in failed:
+            print(f"   {os.path.basename(r['workbook'])}: {r['error']}")
+    print()
+
+
+def parse_args(argv=None):
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Generate DSS template files for every workbook in a directory or glob."
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        help="Workbook files, directories or glob patterns (quote globs on Windows)"
+    )
+    parser.add_argument(
+        "-o", "--output-dir",
+        default="batch_output",
+        help="Folder receiving one sub-folder per workbook (default: batch_output)"
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Write per-row detail lines to each run.log"
+    )
+    parser.add_argument(
+        "--by-site",
+        action="store_true",
+        help="One file per site and band+carrier pattern (site-partitioned mode)"
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes (default: number of CPU cores)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Process workbooks from the command line
+    
+    Returns:
+        int: Exit code (0 if every workbook succeeded)
+    """
+    args = parse_args(argv)
+    
+    workbooks = find_workbooks(args.inputs)
+    if not workbooks:
+        print("⚠️  No workbooks found")
+        return 1
+    
+    output_dir = os.path.abspath(args.output_dir)
+    output_folders = assign_output_folders(workbooks, output_dir)
+    workers = max(1, min(args.workers, len(workbooks)))
+    
+    # Templates and caches are resolved relative to the tool's folder
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    
+    print(f"🔵 Processing {len(workbooks)} workbook(s) with {workers} worker(s)")
+    print(f"   Output: {output_dir}")
+    print()
+    
+    results = []
+    start_time = time.perf_counter()
+    
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = {
+            executor.submit(process_workbook, path, output_folders[path], args.verbose, args.by_site): path
+            for path in workbooks
+        }
+        
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker process itself died
+                result = {
+                    "workbook": path,
+                    "output_folder": output_folders[path],
+                    "files": 0,
+                    "seconds": 0.0,
+                    "error": str(e) or e.__class__.__name__
+                }
+            results.append(result)
+            
+            status = "✅" if result["error"] is None else "❌"
+            print(f"{status} [{len(results)}/{len(workbooks)}] {os.path.basename(path)}: "
+                  f"{result['files']} file(s) in {result['seconds']:.2f}s")
+    
+    print_summary(results, time.perf_counter() - start_time)
+    
+    return 0 if all(r["error"] is None for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
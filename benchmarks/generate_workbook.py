@@ -0,0 +1,173 @@
+#==============================================================================
+# SYNTHETIC WORKBOOK GENERATOR
+#==============================================================================
+# Description: Build realistic DSS workbooks ("5G Info", "Mixed Mode Info",
+#              "eUtran Parameters") at any scale for benchmarking
+# Brand: MASTEC
+# Developer: AKSHATHA KALLUR
+#==============================================================================
+#
+# Usage:
+#     python benchmarks/generate_workbook.py market_10k.xlsx --rows 10000
+#     python benchmarks/generate_workbook.py market_1m.xlsx --rows 1000000 --four-sector-ratio 0.3
+#
+
+import argparse
+import os
+import random
+import sys
+import time
+import openpyxl
+
+# (NR band, LTE band digit used in the anchor cell name)
+DEFAULT_BANDS = [("N066", "9"), ("N002", "2")]
+DEFAULT_CARRIERS = 2
+
+# Market prefixes used for gNB site names, e.g. NCRN002376
+MARKET_PREFIXES = ["NCRN", "SCRN", "VARN", "GAAT", "FLTP"]
+
+FIVE_G_COLUMNS = [
+    "gNBId",
+    "gNB Name",
+    "NRCellDU",
+    "DSS",
+    "Operating Band",
+    "SectorEquipmentFunction",
+    "cellLocalId",
+    "Carrier",
+    "ssbFrequency"
+]
+MIXED_MODE_COLUMNS = ["gNodeB Name", "gNBId", "Node to be built as", "eNBId", "eNodeB Name"]
+EUTRAN_COLUMNS = ["EUtranCellFDDId", "sectorId", "cellId"]
+
+
+def generate_workbook(output_path, rows, four_sector_ratio=0.5, dss_ratio=0.75,
+                      extra_columns=20, bands=DEFAULT_BANDS, carriers=DEFAULT_CARRIERS,
+                      seed=1):
+    """
+    Write a synthetic workbook with whole sites until the row target is met
+    
+    Each site gets 3 (Alpha-Gamma) or 4 (Alpha-Delta) sectors on every band
+    and carrier, e.g. NRCellDU NCRN002376_N066A_1 anchored on the LTE cell
+    WCL03194_9A_1. Cells not picked for DSS carry "NO" in the DSS column.
+    
+    Args:
+        output_path: .xlsx file to write
+        rows: Target number of "5G Info" data rows
+        four_sector_ratio: Share of sites with a Delta sector (0.0 - 1.0)
+        dss_ratio: Share of band/carrier layers that are DSS-enabled
+        extra_columns: Unused filler columns per sheet, as in real exports
+        bands: (NR band, LTE band digit) pairs
+        carriers: Carriers per band
+        seed: Random seed, so the same arguments give the same workbook
+    
+    Returns:
+        dict: Workbook statistics (rows, sites, dss_rows, eutran_rows, seconds, size_mb)
+    """
+    start_time = time.perf_counter()
+    rng = random.Random(seed)
+    
+    # Write-only mode streams rows to disk, so 1M-row sheets fit in memory
+    workbook = openpyxl.Workbook(write_only=True)
+    five_g = workbook.create_sheet("5G Info")
+    mixed_mode = workbook.create_sheet("Mixed Mode Info")
+    eutran = workbook.create_sheet("eUtran Parameters")
+    
+    fillers = [f"Parameter {i + 1}" for i in range(extra_columns)]
+    five_g.append(FIVE_G_COLUMNS + fillers)
+    mixed_mode.append(MIXED_MODE_COLUMNS + fillers)
+    eutran.append(EUTRAN_COLUMNS + fillers)
+    filler_values = ["-"] * extra_columns
+    
+    total_rows = 0
+    dss_rows = 0
+    eutran_rows = 0
+    site_index = 0
+    cell_local_id = 0
+    
+    while total_rows < rows:
+        prefix = MARKET_PREFIXES[site_index % len(MARKET_PREFIXES)]
+        site_name = f"{prefix}{2376 + site_index:06d}"
+        lte_site = f"WCL{3194 + site_index:05d}"
+        gnb_id = 1000 + site_index
+        enb_id = 500 + site_index
+        sectors = "ABCD" if rng.random() < four_sector_ratio else "ABC"
+        
+        mixed_mode.append([site_name, gnb_id, f"MMBB_{site_name}", enb_id, lte_site] + filler_values)
+        
+        for band, lte_band in bands:
+            for carrier in range(1, carriers + 1):
+                is_dss = rng.random() < dss_ratio
+                for sector_number, sector in enumerate(sectors, start=1):
+                    cell_local_id += 1
+                    lte_cell = f"{lte_site}_{lte_band}{sector}_{carrier}"
+                    
+                    five_g.append([
+                        gnb_id,
+                        site_name,
+                        f"{site_name}_{band}{sector}_{carrier}",
+                        lte_cell if is_dss else "NO",
+                        band,
+                        f"{site_name}_{band}{sector}",
+                        cell_local_id,
+                        carrier,
+                        600000 + cell_local_id
+                    ] + filler_values)
+                    total_rows += 1
+                    
+                    if is_dss:
+                        dss_rows += 1
+                        eutran.append([lte_cell, sector_number, cell_local_id] + filler_values)
+                        eutran_rows += 1
+        
+        site_index += 1
+    
+    output_folder = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(output_folder, exist_ok=True)
+    workbook.save(output_path)
+    
+    return {
+        "rows": total_rows,
+        "sites": site_index,
+        "dss_rows": dss_rows,
+        "eutran_rows": eutran_rows,
+        "seconds": time.perf_counter() - start_time,
+        "size_mb": os.path.getsize(output_path) / (1024 * 1024)
+    }
+
+
+def parse_args(argv=None):
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description="Generate a synthetic DSS workbook.")
+    parser.add_argument("output", help="Workbook file to write (.xlsx)")
+    parser.add_argument("--rows", type=int, default=1000, help="Target '5G Info' rows (default: 1000)")
+    parser.add_argument("--four-sector-ratio", type=float, default=0.5,
+                        help="Share of sites with a Delta sector (default: 0.5)")
+    parser.add_argument("--dss-ratio", type=float, default=0.75,
+                        help="Share of band/carrier layers that are DSS (default: 0.75)")
+    parser.add_argument("--extra-columns", type=int, default=20,
+                        help="Filler columns per sheet (default: 20)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed (default: 1)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Generate a workbook from the command line"""
+    args = parse_args(argv)
+    
+    print(f"🔵 Generating {args.output} ({args.rows} rows)...")
+    stats = generate_workbook(
+        args.output,
+        args.rows,
+        four_sector_ratio=args.four_sector_ratio,
+        dss_ratio=args.dss_ratio,
+        extra_columns=args.extra_columns,
+        seed=args.seed
+    )
+    print(f"✅ {stats['rows']} rows, {stats['sites']} sites, {stats['dss_rows']} DSS rows, "
+          f"{stats['size_mb']:.1f} MB in {stats['seconds']:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
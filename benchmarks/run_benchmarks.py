@@ -0,0 +1,278 @@
+#==============================================================================
+# SCALING BENCHMARK
+#==============================================================================
+# Description: Time every feature and the full upload path on synthetic
+#              workbooks of increasing size and write comparable results
+# Brand: MASTEC
+# Developer: AKSHATHA KALLUR
+#==============================================================================
+#
+# Usage:
+#     python benchmarks/run_benchmarks.py
+#     python benchmarks/run_benchmarks.py --sizes 1000 100000 1000000 --repeat 3
+#
+# Results are written to benchmarks/results/benchmark_<timestamp>.json
+# (environment, every run, per-stage medians) and a matching .csv with one
+# row per size / path / stage and per timed step within each stage (one
+# feature method, e.g. feature4.populate_variable), so runs from different
+# commits can be diffed.
+#
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCHMARK_DIR)
+sys.path.insert(0, REPO_DIR)
+
+import pandas as pd
+from config import Config
+from generate_workbook import generate_workbook
+from instrumentation import StageTimer
+from pipeline import STAGE_STEPS, process_excel_file, run_pipeline
+from streaming import STREAM_STEPS
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+# Timed step → "<feature>.<method>"; Features 3-6 share one streaming stage,
+# so their steps are what times each feature
+STEP_LABELS = {
+    name: f"feature{number}.{name}"
+    for number, names in STAGE_STEPS.items() for name in names
+}
+STEP_LABELS.update({
+    name: f"{feature}.{name}"
+    for feature, names in STREAM_STEPS.items() for name in names
+})
+
+
+def get_workbook(data_dir, rows, four_sector_ratio, seed):
+    """
+    Generate a workbook for a size, reusing an earlier one with the same settings
+    
+    Returns:
+        tuple: (workbook path, generation stats or None if reused)
+    """
+    file_name = f"dss_{rows}_rows_{int(four_sector_ratio * 100)}pct4s_seed{seed}.xlsx"
+    path = os.path.join(data_dir, file_name)
+    if os.path.exists(path):
+        return path, None
+    
+    print(f"   Generating {file_name}...")
+    stats = generate_workbook(path, rows, four_sector_ratio=four_sector_ratio, seed=seed)
+    print(f"   ✅ {stats['sites']} sites, {stats['size_mb']:.1f} MB in {stats['seconds']:.1f}s")
+    return path, stats
+
+
+def benchmark_config(args):
+    """Config for one timed run: caches off unless warm runs were requested"""
+    config = Config()
+    config.result_cache_enabled = False
+    config.sheet_cache_enabled = args.warm_sheet_cache
+    config.stage_memory_tracking = args.track_memory
+    return config
+
+
+def time_pipeline(workbook_path, args):
+    """
+    Run Features 1-6 directly
+    
+    Returns:
+        tuple: (StageTimer, wall seconds, generated file count)
+    """
+    config = benchmark_config(args)
+    config.excel_file_path = workbook_path
+    timer = StageTimer(track_memory=config.stage_memory_tracking)
+    
+    start_time = time.perf_counter()
+    # Feature diagnostics are part of the cost but not of the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        generated_files = run_pipeline(config, timer=timer)
+    
+    return timer, time.perf_counter() - start_time, len(generated_files or [])
+
+
+def time_upload_path(workbook_path, args):
+    """
+    Run the Streamlit upload path (workspace, log capture, pipeline, cleanup)
+    
+    Returns:
+        tuple: (StageTimer, wall seconds, generated file count)
+    """
+    with open(workbook_path, 'rb') as f:
+        file_bytes = f.read()
+    
+    config = benchmark_config(args)
+    timer = StageTimer(track_memory=config.stage_memory_tracking)
+    
+    start_time = time.perf_counter()
+    generated_files = process_excel_file(
+        file_bytes,
+        os.path.basename(workbook_path),
+        timer=timer,
+        config=config
+    )
+    
+    return timer, time.perf_counter() - start_time, len(generated_files or [])
+
+
+def summarize(runs):
+    """
+    Median and best time per size, path, stage and step within each stage
+    
+    Returns:
+        list: Summary rows (also written to the CSV); step is "" on the
+            row for a whole stage
+    """
+    samples = {}
+    for run in runs:
+        base = (run["rows"], run["path"])
+        samples.setdefault(base + ("total", ""), []).append(run["total_seconds"])
+        for stage in run["stages"]:
+            samples.setdefault(base + (stage["name"], ""), []).append(stage["seconds"])
+            for step_name, step in stage["steps"].items():
+                step_label = STEP_LABELS.get(step_name, step_name)
+                samples.setdefault(base + (stage["name"], step_label), []).append(step["seconds"])
+    
+    summary = []
+    for (rows, path, stage, step), seconds in samples.items():
+        median = statistics.median(seconds)
+        summary.append({
+            "rows": rows,
+            "path": path,
+            "stage": stage,
+            "step": step,
+            "runs": len(seconds),
+            "median_seconds": round(median, 6),
+            "min_seconds": round(min(seconds), 6),
+            "rows_per_second": round(rows / median, 1) if median > 0 else None
+        })
+    return summary
+
+
+def environment_info():
+    """Machine and library versions, so results files are comparable"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        commit = None
+    
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count()
+    }
+
+
+def write_results(results_dir, environment, settings, runs, summary):
+    """
+    Write the JSON and CSV results files
+    
+    Returns:
+        tuple: (json path, csv path)
+    """
+    os.makedirs(results_dir, exist_ok=True)
+    stem = os.path.join(results_dir, f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    
+    with open(stem + ".json", 'w', encoding='utf-8') as f:
+        json.dump({
+            "environment": environment,
+            "settings": settings,
+            "summary": summary,
+            "runs": runs
+        }, f, indent=2)
+    
+    with open(stem + ".csv", 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(summary[0].keys()))
+        writer.writeheader()
+        writer.writerows(summary)
+    
+    return stem + ".json", stem + ".csv"
+
+
+def parse_args(argv=None):
+    """Parse command-line arguments"""
+    parser = argparse.ArgumentParser(description="Benchmark the DSS pipeline on synthetic workbooks.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="'5G Info' row counts to benchmark (default: 1000 10000 100000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per size and path (default: 3)")
+    parser.add_argument("--four-sector-ratio", type=float, default=0.5,
+                        help="Share of 4-sector sites in generated workbooks (default: 0.5)")
+    parser.add_argument("--seed", type=int, default=1, help="Generator seed (default: 1)")
+    parser.add_argument("--data-dir", default=os.path.join(BENCHMARK_DIR, "data"),
+                        help="Where generated workbooks are kept and reused")
+    parser.add_argument("--results-dir", default=os.path.join(BENCHMARK_DIR, "results"),
+                        help="Where results files are written")
+    parser.add_argument("--warm-sheet-cache", action="store_true",
+                        help="Keep the parsed-sheet cache on (measures repeat uploads)")
+    parser.add_argument("--track-memory", action="store_true",
+                        help="Record per-stage peak memory with tracemalloc (slower)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Run the benchmark suite from the command line"""
+    args = parse_args(argv)
+    
+    # Templates and caches are resolved relative to the tool's folder
+    os.chdir(REPO_DIR)
+    
+    runs = []
+    for rows in args.sizes:
+        print(f"🔵 {rows} rows")
+        workbook_path, _ = get_workbook(args.data_dir, rows, args.four_sector_ratio, args.seed)
+        
+        for path_name, benchmark in (("pipeline", time_pipeline), ("process_excel_file", time_upload_path)):
+            for repeat in range(args.repeat):
+                timer, seconds, file_count = benchmark(workbook_path, args)
+                runs.append({
+                    "rows": rows,
+                    "path": path_name,
+                    "repeat": repeat + 1,
+                    "files": file_count,
+                    "total_seconds": seconds,
+                    "stages": timer.stages
+                })
+                print(f"   {path_name} #{repeat + 1}: {seconds:.3f}s, {file_count} file(s)")
+    
+    summary = summarize(runs)
+    settings = {
+        "sizes": args.sizes,
+        "repeat": args.repeat,
+        "four_sector_ratio": args.four_sector_ratio,
+        "seed": args.seed,
+        "warm_sheet_cache": args.warm_sheet_cache,
+        "track_memory": args.track_memory
+    }
+    json_path, csv_path = write_results(args.results_dir, environment_info(), settings, runs, summary)
+    
+    print()
+    print("📊 MEDIAN SECONDS")
+    table = pd.DataFrame(summary).pivot_table(
+        index=["stage", "step"], columns=["path", "rows"], values="median_seconds", sort=False
+    )
+    print(table.to_string())
+    print()
+    print(f"✅ Results: {json_path}")
+    print(f"           {csv_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
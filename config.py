@@ -18,6 +18,57 @@ class Config:
         # Worksheet names
         self.target_worksheet = "5G Info"
         
+        # Worksheet reader: "projected" streams only the columns listed in
+        # sheet_columns (openpyxl read-only), "full" parses every column
+        self.sheet_reader_mode = "projected"
+        self.sheet_columns = {
+            "5G Info": [
+                'DSS',
+                'NRCellDU',
+                'gNBId',
+                'gNB Name',
+                'SectorEquipmentFunction',
+                'cellLocalId',
+                'Carrier',
+                'ssbFrequency',
+                'Operating Band'
+            ],
+            "Mixed Mode Info": [
+                'gNodeB Name',
+                'gNBId',
+                'Node to be built as',
+                'eNBId',
+                'eNodeB Name'
+            ],
+            "eUtran Parameters": [
+                'EUtranCellFDDId',
+                'sectorId',
+                'cellId'
+            ]
+        }
+        
+        # Parsed-worksheet cache, keyed by SHA-256 of the upload + sheet name
+        self.sheet_cache_enabled = True
+        self.sheet_cache_dir = os.path.join(".cache", "sheets")
+        self.sheet_cache_max_mb = 512
+        
+        # Generated-file cache, keyed by upload hash + template hashes + the
+        # settings that shape the output; repeat uploads skip Features 1-6
+        self.result_cache_enabled = True
+        self.result_cache_dir = os.path.join(".cache", "results")
+        self.result_cache_max_mb = 256
+        
+        # Worksheets the pipeline reads; parsed concurrently in a process
+        # pool when the upload is at least parallel_sheet_min_mb
+        self.pipeline_worksheets = [
+            "5G Info",
+            "Mixed Mode Info",
+            "eUtran Parameters"
+        ]
+        self.parallel_sheet_loading = True
+        self.parallel_sheet_min_mb = 2
+        self.sheet_loader_workers = 3
+        
         # Column names
         self.dss_column_name = "DSS"
         self.nrcelldu_column_name = "NRCellDU"
@@ -36,6 +87,47 @@ class Config:
         
         # Output settings
         self.output_json_file = "dss_output.json"
+        
+        # Generated files are returned in memory; set write_output_files to
+        # also persist them under output_folder
+        self.output_folder = "output_templates"
+        self.write_output_files = False
+        
+        # zlib level for the "Download All" ZIP (0 = store, 9 = smallest)
+        self.zip_compression_level = 6
+        
+        # Background jobs: concurrent runs, how long results stay available
+        # for reconnecting browsers, and the UI progress refresh interval
+        self.max_concurrent_jobs = 4
+        self.job_retention_minutes = 60
+        self.job_poll_seconds = 1.0
+        # Download buttons shown while a job is still rendering (newest)
+        self.live_download_limit = 30
+        
+        # Site-partitioned mode: group by (site_column_name, band+carrier
+        # pattern) so every site gets its own output file per layer; batches
+        # of partitions_per_task partitions run Features 3-6 in
+        # partition_workers processes (1 = in the pipeline's own process)
+        self.partition_by_site = False
+        self.site_column_name = "gNB Name"
+        self.partition_workers = os.cpu_count() or 1
+        self.partitions_per_task = 250
+        
+        # Run logs: newest log_buffer_lines stay in memory, the full log is
+        # spilled to a temporary file (log_spill_dir, system temp if None);
+        # the UI shows the last log_tail_lines plus a full-log download
+        self.log_buffer_lines = 2000
+        self.log_tail_lines = 200
+        self.log_spill_dir = None
+        
+        # Per-stage instrumentation: timings and process peak RSS are always
+        # recorded; per-stage peak memory uses tracemalloc, which slows
+        # allocation-heavy stages several times, so it is opt-in
+        self.stage_memory_tracking = False
+        self.stage_timings_file = "stage_timings.json"
+        
+        # Log level: summaries only by default; verbose adds per-row and
+        # per-lookup detail lines (slow on large workbooks)
         self.verbose = False  # Disable verbose for Streamlit
     
     def set_excel_file_path(self, file_path):
@@ -0,0 +1,155 @@
+#==============================================================================
+# DISK CACHE
+#==============================================================================
+# Description: Size-bounded LRU cache of pickled objects on local disk
+# Brand: MASTEC
+# Developer: AKSHATHA KALLUR
+#==============================================================================
+
+import hashlib
+import os
+import pickle
+import tempfile
+
+class DiskCache:
+    """Size-bounded, least-recently-used cache of pickled objects"""
+    
+    # Bump when the layout of cached objects changes
+    FORMAT_VERSION = "1"
+    
+    def __init__(self, cache_dir, max_bytes):
+        """
+        Initialize the disk cache
+        
+        Args:
+            cache_dir: Directory holding the cache entries
+            max_bytes: Total size the entries may occupy before eviction
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+    
+    @staticmethod
+    def hash_file(file_path, chunk_size=1024 * 1024):
+        """
+        Compute the SHA-256 digest of a file
+        
+        Args:
+            file_path: Path of the file to hash
+            chunk_size: Bytes read per iteration
+        
+        Returns:
+            str: Hex digest
+        """
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    @classmethod
+    def make_key(cls, *parts):
+        """
+        Build a cache key from arbitrary parts
+        
+        Args:
+            *parts: Values identifying the cached object
+        
+        Returns:
+            str: Hex digest usable as a file name
+        """
+        digest = hashlib.sha256(cls.FORMAT_VERSION.encode('utf-8'))
+        for part in parts:
+            digest.update(b'\x00')
+            digest.update(repr(part).encode('utf-8'))
+        return digest.hexdigest()
+    
+    def entry_path(self, key):
+        """Path of the file that stores an entry"""
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+    
+    def get(self, key):
+        """
+        Load an entry and mark it as recently used
+        
+        Args:
+            key: Cache key from make_key
+        
+        Returns:
+            object: Cached object, or None on a miss
+        """
+        path = self.entry_path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Corrupt or incompatible entry: drop it and treat as a miss
+            self.discard(key)
+            return None
+        
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+    
+    def put(self, key, value):
+        """
+        Store an entry, then evict old entries beyond the size limit
+        
+        Args:
+            key: Cache key from make_key
+            value: Picklable object to store
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        
+        # Write to a temporary file first so readers never see partial entries
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.entry_path(key))
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        
+        self.evict()
+    
+    def discard(self, key):
+        """Remove an entry if it exists"""
+        try:
+            os.remove(self.entry_path(key))
+        except OSError:
+            pass
+    
+    def evict(self):
+        """Delete least recently used entries until the cache fits max_bytes"""
+        entries = []
+        total_bytes = 0
+        
+        try:
+            names = os.listdir(self.cache_dir)
+        except FileNotFoundError:
+            return
+        
+        for name in names:
+            if not name.endswith('.pkl'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_bytes += stat.st_size
+        
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total_bytes -= size
+            except OSError:
+                pass
@@ -6,47 +6,51 @@
 # Developer: AKSHATHA KALLUR
 #==============================================================================
 
-import pandas as pd
+from log_config import get_logger
 from utils import DataUtils
+from workbook import WorkbookSession
+
+logger = get_logger(__name__)
 
 class Feature1:
     """Feature 1: DSS Value Extraction"""
     
-    def __init__(self, config):
-        """Initialize Feature 1"""
+    def __init__(self, config, session=None):
+        """
+        Initialize Feature 1
+        
+        Args:
+            config: Config object with application settings
+            session: Shared WorkbookSession (a private one is opened if None)
+        """
         self.config = config
+        self.session = session if session is not None else WorkbookSession(config)
         self.df = None
         self.filtered_df = None
         self.dss_column = None
     
     def read_worksheet(self):
         """Read the target worksheet from Excel file"""
-        print("📊 Reading '5G Info' worksheet...")
+        logger.info("📊 Reading '5G Info' worksheet...")
         
         try:
-            xl_file = pd.ExcelFile(self.config.excel_file_path)
-            
-            # Find the target sheet (case-insensitive)
-            target_sheet = DataUtils.find_worksheet_case_insensitive(
-                xl_file, 
-                self.config.target_worksheet
-            )
+            # Find and parse the target sheet (case-insensitive)
+            target_sheet, self.df = self.session.get_sheet(self.config.target_worksheet)
             
             if target_sheet is None:
                 raise ValueError(
                     f"'{self.config.target_worksheet}' worksheet not found. "
-                    f"Available sheets: {xl_file.sheet_names}"
+                    f"Available sheets: {self.session.sheet_names}"
                 )
             
-            self.df = pd.read_excel(self.config.excel_file_path, sheet_name=target_sheet)
-            print(f"✅ Loaded '{target_sheet}' ({len(self.df)} rows)")
+            logger.info("✅ Loaded '%s' (%d rows)", target_sheet, len(self.df))
             
         except Exception as e:
             raise Exception(f"Error reading worksheet: {str(e)}")
     
     def find_dss_column(self):
         """Locate DSS column in the worksheet"""
-        print("🔍 Locating DSS column...")
+        logger.info("🔍 Locating DSS column...")
         
         self.dss_column = DataUtils.find_column_case_insensitive(
             self.df, 
@@ -59,11 +63,11 @@ class Feature1:
                 f"Available columns: {self.df.columns.tolist()}"
             )
         
-        print(f"✅ Found DSS column: '{self.dss_column}'")
+        logger.info("✅ Found DSS column: '%s'", self.dss_column)
     
     def filter_dss_rows(self):
         """Filter rows where DSS is not equal to exclude value"""
-        print("🔎 Filtering rows where DSS ≠ 'NO'...")
+        logger.info("🔎 Filtering rows where DSS ≠ 'NO'...")
         
         # Create mask for filtering
         mask = (
@@ -72,14 +76,16 @@ class Feature1:
              self.config.dss_exclude_value.upper())
         )
         
-        self.filtered_df = self.df[mask].copy()
+        # Boolean indexing already returns a new frame; later stages only
+        # read it through row views, so no extra copy is needed
+        self.filtered_df = self.df[mask]
         
         no_count = (
             self.df[self.dss_column].astype(str).str.strip().str.upper() == 
             self.config.dss_exclude_value.upper()
         ).sum()
         
-        print(f"✅ Extracted {len(self.filtered_df)} rows (excluded {no_count} 'NO' values)")
+        logger.info("✅ Extracted %d rows (excluded %d 'NO' values)", len(self.filtered_df), no_count)
     
     def execute(self):
         """Execute Feature 1: DSS Extraction"""
@@ -90,6 +96,6 @@ class Feature1:
             return self.filtered_df
             
         except Exception as e:
-            print(f"❌ Error in Feature 1: {str(e)}")
+            logger.error("❌ Error in Feature 1: %s", e)
             raise
 
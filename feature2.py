@@ -1,15 +1,25 @@
 #==============================================================================
 # FEATURE 2: NRCELLDU GROUPING
 #==============================================================================
-# Description: Group extracted rows by band+carrier pattern
+# Description: Group extracted rows by band+carrier pattern (optionally
+#              per site)
 # Brand: MASTEC
 # Developer: AKSHATHA KALLUR
 
 #==============================================================================
 
+import logging
+import re
 import pandas as pd
+from log_config import get_logger
+from row_views import FrameColumns, GroupRows
 from utils import DataUtils
 
+logger = get_logger(__name__)
+
+# Characters not allowed in a partition's output file name
+UNSAFE_NAME_CHARS = re.compile(r'[^\w.-]+')
+
 class Feature2:
     """Feature 2: NRCellDU Grouping"""
     
@@ -24,13 +34,15 @@ class Feature2:
         self.config = config
         self.filtered_df = filtered_df
         self.nrcelldu_column = None
+        # Group key → positions of its rows in filtered_df
         self.groups = {}
+        self.frame_columns = None
         self.dss_variables = {}
     
     def find_nrcelldu_column(self):
         """Locate NRCellDU column"""
-        print("🔍 Step 1: Locating NRCellDU column")
-        print("-" * 80)
+        logger.info("🔍 Step 1: Locating NRCellDU column")
+        logger.info("-" * 80)
         
         self.nrcelldu_column = DataUtils.find_column_case_insensitive(
             self.filtered_df,
@@ -40,98 +52,169 @@ class Feature2:
         if self.nrcelldu_column is None:
             raise ValueError("NRCellDU column not found in worksheet")
         
-        print(f"✅ Found NRCellDU column: '{self.nrcelldu_column}'")
-        print()
+        logger.info("✅ Found NRCellDU column: '%s'", self.nrcelldu_column)
+        logger.info("")
     
     def analyze_nrcelldu_values(self):
         """Analyze NRCellDU values"""
-        print("📊 Step 2: Analyzing NRCellDU values")
-        print("-" * 80)
+        logger.info("📊 Step 2: Analyzing NRCellDU values")
+        logger.info("-" * 80)
         
-        nrcelldu_values = self.filtered_df[self.nrcelldu_column].tolist()
-        print(f"Total NRCellDU values found: {len(nrcelldu_values)}")
-        print(f"NRCellDU values: {nrcelldu_values}")
-        print()
+        nrcelldu_values = self.filtered_df[self.nrcelldu_column]
+        logger.info("Total NRCellDU values found: %d", len(nrcelldu_values))
+        # The full list is only built when verbose output is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("NRCellDU values: %s", nrcelldu_values.tolist())
+        logger.info("")
     
-    def create_groups(self):
-        """Create groups based on band+carrier pattern"""
-        print("🔎 Step 3: Grouping by band and carrier pattern")
-        print("-" * 80)
+    def get_sites(self):
+        """
+        Site of every row, for site-partitioned grouping
         
-        # Find DSS column
-        dss_column = DataUtils.find_column_case_insensitive(
+        Returns:
+            Series: Stripped site names ("UNKNOWN" where missing)
+        """
+        site_column = DataUtils.find_column_case_insensitive(
             self.filtered_df,
-            self.config.dss_column_name
+            self.config.site_column_name
         )
         
-        group_mapping = {}
+        if site_column is None:
+            raise ValueError(f"{self.config.site_column_name} column not found in worksheet")
         
-        for idx, row in self.filtered_df.iterrows():
-            nrcelldu = row[self.nrcelldu_column]
-            pattern = DataUtils.extract_band_carrier_pattern(nrcelldu)
-            
-            if pattern not in self.groups:
-                self.groups[pattern] = []
-            
-            # Convert row to dictionary
-            row_dict = row.to_dict()
-            self.groups[pattern].append(row_dict)
-            
-            # Track mapping
-            if pattern not in group_mapping:
-                group_mapping[pattern] = []
-            group_mapping[pattern].append(nrcelldu)
+        sites = self.filtered_df[site_column].astype("string").str.strip()
+        return sites.fillna("UNKNOWN").replace("", "UNKNOWN")
+    
+    def create_groups(self):
+        """Create groups based on band+carrier pattern (and site if partitioned)"""
+        if self.config.partition_by_site:
+            grouping = "site and band+carrier pattern"
+        else:
+            grouping = "band+carrier pattern"
+        logger.info("🔎 Step 3: Grouping by %s", grouping)
+        logger.info("-" * 80)
+        
+        # Derive every row's pattern in one pass, then split by pattern
+        # (groups keep first-appearance order, rows keep sheet order).
+        # Only row positions are kept; rows are read through views
+        patterns = DataUtils.extract_band_carrier_patterns(
+            self.filtered_df[self.nrcelldu_column]
+        )
+        
+        # Partitioned groups are keyed by (site, pattern)
+        keys = patterns
+        if self.config.partition_by_site:
+            keys = [self.get_sites(), patterns]
+        
+        self.groups = self.filtered_df.groupby(keys, sort=False, dropna=False).indices
         
-        print(f"✅ Created {len(self.groups)} group(s) based on band+carrier pattern")
-        print()
+        logger.info("✅ Created %d group(s) based on %s", len(self.groups), grouping)
+        logger.info("")
         
         # Display grouping details
-        print("📋 Grouping Details:")
-        print("-" * 80)
-        for pattern, nrcelldu_list in group_mapping.items():
-            print(f"Pattern: {pattern}")
-            print(f"  NRCellDU values: {', '.join(map(str, nrcelldu_list))}")
-            print()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📋 Grouping Details:")
+            logger.debug("-" * 80)
+            nrcelldu_values = self.filtered_df[self.nrcelldu_column]
+            for pattern, positions in self.groups.items():
+                logger.debug("Pattern: %s", pattern)
+                logger.debug("  NRCellDU values: %s", ', '.join(map(str, nrcelldu_values.take(positions))))
+                logger.debug("")
     
     def create_dss_variables(self):
         """Create DSS JSON variables"""
-        print("📦 Step 4: Creating DSS JSON variables")
-        print("-" * 80)
+        logger.info("📦 Step 4: Creating DSS JSON variables")
+        logger.info("-" * 80)
         
+        for var_name, variable in self.iter_dss_variables():
+            self.dss_variables[var_name] = variable
+        
+        if self.config.partition_by_site:
+            logger.info("✅ Created %d site partition(s)", len(self.dss_variables))
+        logger.info("")
+    
+    def iter_dss_variables(self):
+        """
+        Yield DSS JSON variables one group at a time
+        
+        Rows are GroupRows views into filtered_df, so no row is copied;
+        each group is built only when it is reached. Names and order match
+        create_dss_variables.
+        
+        Yields:
+            tuple: (variable name, variable data)
+        """
         # Find DSS column
         dss_column = DataUtils.find_column_case_insensitive(
             self.filtered_df,
             self.config.dss_column_name
         )
         
-        for i, (pattern, rows) in enumerate(sorted(self.groups.items()), start=1):
+        partitioned = self.config.partition_by_site
+        # One line per group is too much for thousands of site partitions
+        log_group = logger.debug if partitioned else logger.info
+        partition_names = set()
+        
+        # Columns are converted once and shared by every group's view
+        if self.frame_columns is None:
+            self.frame_columns = FrameColumns(self.filtered_df)
+        
+        for i, (key, positions) in enumerate(sorted(self.groups.items()), start=1):
             var_name = f"DSS{i}"
-            self.dss_variables[var_name] = {
+            rows = GroupRows(self.frame_columns, positions)
+            pattern = key[1] if partitioned else key
+            variable = {
                 "group_name": var_name,
                 "band_carrier_pattern": pattern,
                 "total_rows": len(rows),
-                "nrcelldu_values": [row[self.nrcelldu_column] for row in rows],
-                "dss_values": [row[dss_column] for row in rows],
+                "nrcelldu_values": rows.column(self.nrcelldu_column),
+                "dss_values": rows.column(dss_column),
                 "rows": rows
             }
-            print(f"✅ Created {var_name}: {len(rows)} row(s) with pattern '{pattern}'")
+            
+            if partitioned:
+                variable["site"] = key[0]
+                variable["partition_name"] = self.make_partition_name(key[0], pattern, partition_names)
+            
+            log_group("✅ Created %s: %d row(s) with pattern '%s'", var_name, len(rows), pattern)
+            yield var_name, variable
+    
+    def make_partition_name(self, site, pattern, used_names):
+        """
+        Output name of a site partition, e.g. NCRN002376_N066_1
         
-        print()
+        Args:
+            site: Site name
+            pattern: Band+carrier pattern
+            used_names: Names already given out (updated in place)
+        
+        Returns:
+            str: File-name-safe name, suffixed if sanitizing made it collide
+        """
+        base_name = UNSAFE_NAME_CHARS.sub("_", f"{site}_{pattern}")
+        name = base_name
+        suffix = 2
+        while name in used_names:
+            name = f"{base_name}_{suffix}"
+            suffix += 1
+        used_names.add(name)
+        return name
     
     def display_summary(self):
         """Display grouping summary"""
-        print("=" * 80)
-        print("📊 GROUPING SUMMARY")
-        print("=" * 80)
-        print()
+        logger.info("=" * 80)
+        logger.info("📊 GROUPING SUMMARY")
+        logger.info("=" * 80)
+        logger.info("")
         
+        verbose = logger.isEnabledFor(logging.DEBUG)
+        log_group = logger.debug if self.config.partition_by_site else logger.info
         for var_name, data in self.dss_variables.items():
-            print(f"🔹 {var_name}:")
-            print(f"   Band+Carrier Pattern: {data['band_carrier_pattern']}")
-            print(f"   Total Rows: {data['total_rows']}")
-            print(f"   NRCellDU Values: {', '.join(map(str, data['nrcelldu_values']))}")
-            print(f"   DSS Values: {', '.join(map(str, data['dss_values']))}")
-            print()
+            log_group("🔹 %s: pattern %s, %d row(s)", var_name, data['band_carrier_pattern'], data['total_rows'])
+            if verbose:
+                logger.debug("   NRCellDU Values: %s", ', '.join(map(str, data['nrcelldu_values'])))
+                logger.debug("   DSS Values: %s", ', '.join(map(str, data['dss_values'])))
+        logger.info("")
     
     def execute(self):
         """
@@ -150,6 +233,25 @@ class Feature2:
             return self.dss_variables
             
         except Exception as e:
-            print(f"❌ Error in Feature 2: {str(e)}")
+            logger.error("❌ Error in Feature 2: %s", e)
+            raise
+    
+    def stream(self):
+        """
+        Group the rows and hand the DSS variables on one at a time
+        
+        Returns:
+            generator: (variable name, variable data) pairs from
+                iter_dss_variables; len(self.groups) is the total
+        """
+        try:
+            self.find_nrcelldu_column()
+            self.analyze_nrcelldu_values()
+            self.create_groups()
+            
+            return self.iter_dss_variables()
+            
+        except Exception as e:
+            logger.error("❌ Error in Feature 2: %s", e)
             raise
 
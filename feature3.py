@@ -7,8 +7,13 @@
 
 #==============================================================================
 
-import re
+import logging
 from collections import defaultdict
+from log_config import get_logger
+from row_views import GroupRows
+from utils import DataUtils
+
+logger = get_logger(__name__)
 
 class Feature3:
     """Feature 3: JSON Variable Cleaning and Transformation"""
@@ -24,6 +29,8 @@ class Feature3:
         self.config = config
         self.dss_variables = dss_variables
         self.cleaned_variables = {}
+        # Column set → {parameter: column}, see get_row_columns
+        self.row_columns = {}
         
         # Greek letter mapping for sectors
         self.sector_mapping = {
@@ -58,19 +65,12 @@ class Feature3:
         if not value or str(value) == 'nan':
             return None
         
-        value_str = str(value)
-        
-        # Pattern to find sector letter (usually between underscores or at end)
+        # Sector letter follows the band in the shared cell-name record
         # Example: WCL03194_9A_1 → A
         # Example: NCGN003194_N002A_1 → A
-        match = re.search(r'_([A-Z]\d+)([A-Z])_', value_str)
-        if match:
-            return match.group(2)
-        
-        # Alternative pattern
-        match = re.search(r'_(\d+)([A-Z])_', value_str)
-        if match:
-            return match.group(2)
+        cell_name = DataUtils.parse_cell_name(value)
+        if cell_name and cell_name.sector:
+            return cell_name.sector
         
         return None
     
@@ -121,6 +121,28 @@ class Feature3:
         
         return filtered_row
     
+    def get_row_columns(self, column_names):
+        """
+        Match the kept parameters to row columns (case-insensitive)
+        
+        Same matching as filter_row_parameters, done once per column set.
+        
+        Args:
+            column_names: Column names of the rows
+            
+        Returns:
+            dict: {parameter: column name} for every parameter present
+        """
+        key = tuple(column_names)
+        if key not in self.row_columns:
+            column_map = {name.strip().upper(): name for name in column_names}
+            self.row_columns[key] = {
+                param: column_map[param.strip().upper()]
+                for param in self.keep_parameters
+                if param.strip().upper() in column_map
+            }
+        return self.row_columns[key]
+    
     def transform_variable(self, var_name, var_data):
         """
         Transform a single DSS variable
@@ -132,7 +154,7 @@ class Feature3:
         Returns:
             dict: Transformed variable with flattened structure
         """
-        print(f"🔄 Transforming {var_name}...")
+        logger.debug("🔄 Transforming %s...", var_name)
         
         # Initialize cleaned variable with basic info
         cleaned = {
@@ -141,6 +163,11 @@ class Feature3:
             "total_rows": var_data.get("total_rows")
         }
         
+        # Site partitions keep their site and output name
+        for key in ("site", "partition_name"):
+            if key in var_data:
+                cleaned[key] = var_data[key]
+        
         # Track sector occurrences for duplicate handling
         dss_sector_counts = {}
         nr_sector_counts = {}
@@ -161,42 +188,45 @@ class Feature3:
                 greek_name = self.get_greek_name(sector, nr_sector_counts)
                 cleaned[f"NR_{greek_name}"] = nr_value
         
-        # Process rows - filter parameters
+        # Process rows - filter parameters (row views are narrowed without
+        # copying; plain dict rows are filtered one by one)
         rows = var_data.get("rows", [])
-        cleaned["rows"] = []
-        
-        for row in rows:
-            filtered_row = self.filter_row_parameters(row)
-            cleaned["rows"].append(filtered_row)
+        if isinstance(rows, GroupRows):
+            cleaned["rows"] = rows.select(self.get_row_columns(rows.columns))
+        else:
+            cleaned["rows"] = [self.filter_row_parameters(row) for row in rows]
         
-        print(f"   ✅ Added {len(dss_values)} DSS parameters")
-        print(f"   ✅ Added {len(nrcelldu_values)} NR parameters")
-        print(f"   ✅ Filtered {len(cleaned['rows'])} rows to {len(self.keep_parameters)} parameters each")
+        logger.debug("   ✅ Added %s DSS parameters", len(dss_values))
+        logger.debug("   ✅ Added %s NR parameters", len(nrcelldu_values))
+        logger.debug("   ✅ Filtered %s rows to %s parameters each", len(cleaned['rows']), len(self.keep_parameters))
         
         return cleaned
     
     def display_summary(self):
-        """Display transformation summary"""
-        print()
-        print("=" * 80)
-        print("📊 TRANSFORMATION SUMMARY")
-        print("=" * 80)
-        print()
+        """Display transformation summary (verbose only)"""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        
+        logger.debug("")
+        logger.debug("=" * 80)
+        logger.debug("📊 TRANSFORMATION SUMMARY")
+        logger.debug("=" * 80)
+        logger.debug("")
         
         for var_name, data in self.cleaned_variables.items():
-            print(f"🔹 {var_name}:")
-            print(f"   Pattern: {data.get('band_carrier_pattern')}")
-            print(f"   Total Rows: {data.get('total_rows')}")
+            logger.debug("🔹 %s:", var_name)
+            logger.debug("   Pattern: %s", data.get('band_carrier_pattern'))
+            logger.debug("   Total Rows: %s", data.get('total_rows'))
             
             # Show DSS parameters
             dss_params = [k for k in data.keys() if k.startswith('DSS_')]
-            print(f"   DSS Parameters: {', '.join(dss_params)}")
+            logger.debug("   DSS Parameters: %s", ', '.join(dss_params))
             
             # Show NR parameters
             nr_params = [k for k in data.keys() if k.startswith('NR_')]
-            print(f"   NR Parameters: {', '.join(nr_params)}")
+            logger.debug("   NR Parameters: %s", ', '.join(nr_params))
             
-            print()
+            logger.debug("")
     
     def execute(self):
         """
@@ -206,20 +236,20 @@ class Feature3:
             dict: Dictionary of cleaned DSS variables
         """
         try:
-            print("🔍 Step 1: Analyzing DSS variables")
-            print("-" * 80)
-            print(f"Total variables to transform: {len(self.dss_variables)}")
-            print()
+            logger.info("🔍 Step 1: Analyzing DSS variables")
+            logger.info("-" * 80)
+            logger.info("Total variables to transform: %s", len(self.dss_variables))
+            logger.info("")
             
-            print("🔄 Step 2: Transforming variables")
-            print("-" * 80)
+            logger.info("🔄 Step 2: Transforming variables")
+            logger.info("-" * 80)
             
             # Transform each variable
             for var_name, var_data in self.dss_variables.items():
                 self.cleaned_variables[var_name] = self.transform_variable(var_name, var_data)
             
-            print()
-            print(f"✅ Successfully transformed {len(self.cleaned_variables)} variable(s)")
+            logger.info("")
+            logger.info("✅ Successfully transformed %s variable(s)", len(self.cleaned_variables))
             
             # Display summary
             self.display_summary()
@@ -227,6 +257,6 @@ class Feature3:
             return self.cleaned_variables
             
         except Exception as e:
-            print(f"❌ Error in Feature 3: {str(e)}")
+            logger.error("❌ Error in Feature 3: %s", str(e))
             raise
 
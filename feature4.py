@@ -7,50 +7,79 @@
 
 #==============================================================================
 
+import logging
 import pandas as pd
 import re
+from log_config import get_logger
 from utils import DataUtils
+from workbook import WorkbookSession
+
+logger = get_logger(__name__)
 
 class Feature4:
     """Feature 4: JSON Variable Population"""
     
-    def __init__(self, config, cleaned_variables):
-        """Initialize Feature 4"""
+    def __init__(self, config, cleaned_variables, session=None, indexes=None):
+        """
+        Initialize Feature 4
+        
+        Args:
+            config: Config object with application settings
+            cleaned_variables: Dictionary of cleaned variables from Feature 3
+            session: WorkbookSession to read worksheets from
+            indexes: Optional (mixed_mode_index, eutran_index) built by
+                another Feature 4, so partition workers skip the worksheets
+        """
         self.config = config
+        self.session = session if session is not None else WorkbookSession(config)
         self.cleaned_variables = cleaned_variables
         self.populated_variables = {}
         self.mixed_mode_df = None
         self.eutran_df = None
+        self.eutran_index = None
+        self.mixed_mode_index = None
+        self.indexes_loaded = False
+        
+        if indexes is not None:
+            self.mixed_mode_index, self.eutran_index = indexes
+            self.indexes_loaded = True
+    
+    def get_indexes(self):
+        """Lookup indexes to share with other Feature 4 instances"""
+        return self.mixed_mode_index, self.eutran_index
     
     def load_worksheets(self):
         """Load required worksheets from Excel file"""
-        print("📁 Loading Excel worksheets...")
-        print("-" * 80)
+        logger.info("📁 Loading Excel worksheets...")
+        logger.info("-" * 80)
         
         try:
-            xl_file = pd.ExcelFile(self.config.excel_file_path)
-            
             # Load Mixed Mode Info
-            mixed_mode_sheet = DataUtils.find_worksheet_case_insensitive(xl_file, "Mixed Mode Info")
+            mixed_mode_sheet, self.mixed_mode_df = self.session.get_sheet("Mixed Mode Info")
             if mixed_mode_sheet:
-                self.mixed_mode_df = pd.read_excel(self.config.excel_file_path, sheet_name=mixed_mode_sheet)
-                print(f"✅ Loaded '{mixed_mode_sheet}': {len(self.mixed_mode_df)} rows")
+                logger.info("✅ Loaded '%s': %s rows", mixed_mode_sheet, len(self.mixed_mode_df))
+                self.build_mixed_mode_index()
             
             # Load eUtran Parameters
-            eutran_sheet = DataUtils.find_worksheet_case_insensitive(xl_file, "eUtran Parameters")
+            eutran_sheet, self.eutran_df = self.session.get_sheet("eUtran Parameters")
             if eutran_sheet:
-                self.eutran_df = pd.read_excel(self.config.excel_file_path, sheet_name=eutran_sheet)
-                print(f"✅ Loaded '{eutran_sheet}': {len(self.eutran_df)} rows")
+                logger.info("✅ Loaded '%s': %s rows", eutran_sheet, len(self.eutran_df))
+                self.build_eutran_index()
             
-            print()
+            logger.info("")
+            self.indexes_loaded = True
             
         except Exception as e:
             raise Exception(f"Error loading worksheets: {str(e)}")
     
-    def get_primary_node_info(self, gnb_name, gnb_id):
-        """Get primary node information"""
-        if self.mixed_mode_df is None:
-            return {}
+    def build_mixed_mode_index(self):
+        """
+        Index Mixed Mode Info by (gNodeB Name, gNBId)
+        
+        Each key holds the primary node info of its first matching row, so
+        per-group lookups no longer scan the whole sheet.
+        """
+        self.mixed_mode_index = {}
         
         gnodeb_col = DataUtils.find_column_case_insensitive(self.mixed_mode_df, "gNodeB Name")
         gnbid_col = DataUtils.find_column_case_insensitive(self.mixed_mode_df, "gNBId")
@@ -59,36 +88,62 @@ class Feature4:
         enodeb_col = DataUtils.find_column_case_insensitive(self.mixed_mode_df, "eNodeB Name")
         
         if not all([gnodeb_col, gnbid_col]):
-            return {}
+            return
         
-        mask = (self.mixed_mode_df[gnodeb_col] == gnb_name) & (self.mixed_mode_df[gnbid_col] == gnb_id)
-        matching_rows = self.mixed_mode_df[mask]
+        def column_values(col):
+            if col:
+                return self.mixed_mode_df[col].tolist()
+            return [None] * len(self.mixed_mode_df)
         
-        if matching_rows.empty:
-            return {}
+        rows = zip(
+            column_values(gnodeb_col),
+            column_values(gnbid_col),
+            column_values(node_col),
+            column_values(enbid_col),
+            column_values(enodeb_col)
+        )
         
-        row = matching_rows.iloc[0]
-        result = {}
+        for gnodeb_name, gnbid, node, enbid, enodeb_name in rows:
+            # Missing keys never matched the former equality mask
+            if pd.isna(gnodeb_name) or pd.isna(gnbid):
+                continue
+            
+            key = (gnodeb_name, gnbid)
+            if key in self.mixed_mode_index:
+                continue
+            
+            result = {}
+            if node_col and pd.notna(node):
+                result["primary_node"] = node
+            if enbid_col and pd.notna(enbid):
+                # Converted to int on lookup, so a bad value only affects
+                # the group that actually uses it
+                result["eNBId"] = enbid
+            if enodeb_col and pd.notna(enodeb_name):
+                result["lte_siteID"] = enodeb_name
+            
+            self.mixed_mode_index[key] = result
+    
+    def get_primary_node_info(self, gnb_name, gnb_id):
+        """Get primary node information"""
+        if not self.mixed_mode_index:
+            return {}
         
-        if node_col and pd.notna(row[node_col]):
-            result["primary_node"] = row[node_col]
-        if enbid_col and pd.notna(row[enbid_col]):
-            result["eNBId"] = int(row[enbid_col])
-        if enodeb_col and pd.notna(row[enodeb_col]):
-            result["lte_siteID"] = row[enodeb_col]
+        result = dict(self.mixed_mode_index.get((gnb_name, gnb_id), {}))
+        if "eNBId" in result:
+            result["eNBId"] = int(result["eNBId"])
         
         return result
     
-    def get_sector_cell_ids_for_dss(self, dss_value, greek_name):
+    def build_eutran_index(self):
         """
-        Get sectorId and cellId for a SINGLE DSS value
+        Index eUtran Parameters by EUtranCellFDDId
         
-        CRITICAL FIX: DO NOT REMOVE UNDERSCORES - Match exactly as-is!
+        Maps the stripped EUtranCellFDDId string to its (sectorId, cellId)
+        values so each DSS lookup is a dictionary hit. The first matching
+        row wins, as with the former top-to-bottom scan.
         """
-        result = {}
-        
-        if self.eutran_df is None:
-            return result
+        self.eutran_index = {}
         
         # Find column names (case-insensitive)
         eutran_col = None
@@ -105,44 +160,57 @@ class Feature4:
                 cell_col = col
         
         if not eutran_col or not sector_col or not cell_col:
+            return
+        
+        # Keys are compared as-is (underscores kept), only whitespace-stripped
+        keys = self.eutran_df[eutran_col].astype(str).str.strip().tolist()
+        sector_ids = self.eutran_df[sector_col].tolist()
+        cell_ids = self.eutran_df[cell_col].tolist()
+        
+        for key, sector_id, cell_id in zip(keys, sector_ids, cell_ids):
+            if key not in self.eutran_index:
+                self.eutran_index[key] = (sector_id, cell_id)
+    
+    def get_sector_cell_ids_for_dss(self, dss_value, greek_name):
+        """
+        Get sectorId and cellId for a SINGLE DSS value
+        
+        CRITICAL FIX: DO NOT REMOVE UNDERSCORES - Match exactly as-is!
+        """
+        result = {}
+        
+        if not self.eutran_index:
             return result
         
         # CRITICAL FIX: Use DSS value AS-IS, don't remove underscores!
         search_value = str(dss_value).strip()
         
-        print(f"      🔍 Searching for EXACT match: '{search_value}'")
+        logger.debug("      🔍 Searching for EXACT match: '%s'", search_value)
         
-        # Search for exact match
-        match_found = False
-        row_data = None
+        # Exact match through the EUtranCellFDDId index
+        ids = self.eutran_index.get(search_value)
         
-        for idx, row in self.eutran_df.iterrows():
-            cell_value = str(row[eutran_col]).strip()
-            
-            if cell_value == search_value:
-                print(f"      ✅ MATCH FOUND at row {idx}!")
-                match_found = True
-                row_data = row
-                break
-        
-        if not match_found:
-            print(f"      ❌ No match found")
+        if ids is None:
+            logger.debug("      ❌ No match found")
             return result
         
+        logger.debug("      ✅ MATCH FOUND!")
+        sector_id, cell_id = ids
+        
         # Extract sectorId and cellId
-        if pd.notna(row_data[sector_col]):
+        if pd.notna(sector_id):
             try:
-                result[f"{greek_name}_sectorId"] = int(row_data[sector_col])
+                result[f"{greek_name}_sectorId"] = int(sector_id)
             except:
-                result[f"{greek_name}_sectorId"] = row_data[sector_col]
-            print(f"      ✅ {greek_name}_sectorId = {result[f'{greek_name}_sectorId']}")
+                result[f"{greek_name}_sectorId"] = sector_id
+            logger.debug("      ✅ %s_sectorId = %s", greek_name, result[f'{greek_name}_sectorId'])
         
-        if pd.notna(row_data[cell_col]):
+        if pd.notna(cell_id):
             try:
-                result[f"{greek_name}_cellId"] = int(row_data[cell_col])
+                result[f"{greek_name}_cellId"] = int(cell_id)
             except:
-                result[f"{greek_name}_cellId"] = row_data[cell_col]
-            print(f"      ✅ {greek_name}_cellId = {result[f'{greek_name}_cellId']}")
+                result[f"{greek_name}_cellId"] = cell_id
+            logger.debug("      ✅ %s_cellId = %s", greek_name, result[f'{greek_name}_cellId'])
         
         return result
     
@@ -157,9 +225,9 @@ class Feature4:
     
     def populate_variable(self, var_name, var_data):
         """Populate a single DSS variable"""
-        print(f"\n{'='*80}")
-        print(f"🔄 POPULATING {var_name}")
-        print(f"{'='*80}\n")
+        logger.debug("\n%s", '='*80)
+        logger.debug("🔄 POPULATING %s", var_name)
+        logger.debug("%s\n", '='*80)
         
         populated = var_data.copy()
         
@@ -170,15 +238,15 @@ class Feature4:
             gnb_id = first_row.get("gNBId")
             
             if gnb_name and gnb_id:
-                print(f"   1️⃣ Primary Node Info:")
+                logger.debug("   1️⃣ Primary Node Info:")
                 primary_info = self.get_primary_node_info(gnb_name, gnb_id)
                 for key, value in primary_info.items():
                     populated[key] = value
-                    print(f"      ✅ {key} = {value}")
-                print()
+                    logger.debug("      ✅ %s = %s", key, value)
+                logger.debug("")
         
         # 2. Sector and Cell IDs
-        print(f"   2️⃣ Sector and Cell IDs:")
+        logger.debug("   2️⃣ Sector and Cell IDs:")
         
         dss_keys = sorted([k for k in var_data.keys() if k.startswith('DSS_')])
         
@@ -186,17 +254,17 @@ class Feature4:
             dss_value = var_data[dss_key]
             greek_name = dss_key.replace('DSS_', '')
             
-            print(f"   📌 {greek_name.upper()}: '{dss_value}'")
+            logger.debug("   📌 %s: '%s'", greek_name.upper(), dss_value)
             
             sector_cell_data = self.get_sector_cell_ids_for_dss(dss_value, greek_name)
             
             for key, value in sector_cell_data.items():
                 populated[key] = value
         
-        print()
+        logger.debug("")
         
         # 3. Row extractions
-        print(f"   3️⃣ Row Extractions:")
+        logger.debug("   3️⃣ Row Extractions:")
         if "rows" in var_data:
             for idx, row in enumerate(var_data["rows"], start=1):
                 sector_eq = row.get("SectorEquipmentFunction")
@@ -204,40 +272,56 @@ class Feature4:
                     extracted = self.extract_sector_equipment(sector_eq)
                     if extracted:
                         populated[f"row{idx}"] = extracted
-                        print(f"      ✅ row{idx} = {extracted}")
+                        logger.debug("      ✅ row%s = %s", idx, extracted)
         
-        print(f"\n✅ Completed {var_name}\n")
+        logger.debug("\n✅ Completed %s\n", var_name)
         
         return populated
     
+    def has_sector_cell_ids(self, populated):
+        """True if any sector/cell ID was found for a populated variable"""
+        return any('_sectorId' in k or '_cellId' in k for k in populated.keys())
+    
     def display_summary(self):
-        """Display summary"""
-        print("\n" + "="*80)
-        print("📊 FINAL SUMMARY")
-        print("="*80 + "\n")
+        """Display summary (per-variable detail in verbose mode only)"""
+        missing = [
+            var_name for var_name, data in self.populated_variables.items()
+            if not self.has_sector_cell_ids(data)
+        ]
+        logger.info("✅ Populated %d variable(s)", len(self.populated_variables))
+        if missing:
+            logger.warning("⚠️  No sector/cell IDs found for: %s", ', '.join(missing))
+        
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        
+        logger.debug("\n" + "="*80)
+        logger.debug("📊 FINAL SUMMARY")
+        logger.debug("="*80 + "\n")
         
         for var_name, data in self.populated_variables.items():
-            print(f"🔹 {var_name}:")
+            logger.debug("🔹 %s:", var_name)
             
             sector_cell_params = sorted([k for k in data.keys() if '_sectorId' in k or '_cellId' in k])
             
             if sector_cell_params:
-                print(f"   ✅ Sector/Cell IDs: {len(sector_cell_params)}")
+                logger.debug("   ✅ Sector/Cell IDs: %s", len(sector_cell_params))
                 for param in sector_cell_params:
-                    print(f"      • {param}: {data[param]}")
+                    logger.debug("      • %s: %s", param, data[param])
             else:
-                print(f"   ❌ No sector/cell IDs added")
+                logger.debug("   ❌ No sector/cell IDs added")
             
-            print()
+            logger.debug("")
     
     def execute(self):
         """Execute Feature 4"""
         try:
-            self.load_worksheets()
+            if not self.indexes_loaded:
+                self.load_worksheets()
             
-            print("="*80)
-            print("🚀 POPULATING ALL VARIABLES")
-            print("="*80)
+            logger.info("="*80)
+            logger.info("🚀 POPULATING ALL VARIABLES")
+            logger.info("="*80)
             
             for var_name, var_data in self.cleaned_variables.items():
                 self.populated_variables[var_name] = self.populate_variable(var_name, var_data)
@@ -247,8 +331,6 @@ class Feature4:
             return self.populated_variables
             
         except Exception as e:
-            print(f"\n❌ ERROR: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("\n❌ ERROR: %s", str(e))
             raise
 
@@ -5,7 +5,12 @@
 # Developer: AKSHATHA KALLUR
 #==============================================================================
 
-import re
+import logging
+from log_config import get_logger
+from template_engine import placeholder_schema
+from utils import DataUtils
+
+logger = get_logger(__name__)
 
 class Feature5:
     """Feature 5: Placeholder Mapping and New Variable Creation"""
@@ -122,6 +127,9 @@ class Feature5:
             
             "nr_node_n00x": "xx5G_NR_Node_Namexx_N00X"
         }
+        
+        # Mapped variables are fixed-schema records in this placeholder order
+        self.schema = placeholder_schema(self.placeholders.values())
     
     def get_value_case_insensitive(self, data, key):
         """Get value from dictionary with case-insensitive key matching"""
@@ -140,10 +148,10 @@ class Feature5:
         if not nr_value:
             return None
         
-        # UPDATED: Regex expanded to include [A-D] for Delta sector
-        match = re.search(r'_(N\d{3}[A-D]_\d)$', str(nr_value))
-        if match:
-            return match.group(1)
+        # UPDATED: Sectors A-D accepted for Delta sector
+        cell_name = DataUtils.parse_cell_name(nr_value)
+        if cell_name:
+            return cell_name.sector_carrier
         
         return None
     
@@ -161,10 +169,10 @@ class Feature5:
         if not nr_node_value:
             return None
         
-        # UPDATED: Regex expanded to include [A-D] for Delta sector
-        match = re.search(r'^(.+_N\d{3})[A-D]_\d$', str(nr_node_value))
-        if match:
-            return match.group(1)
+        # UPDATED: Sectors A-D accepted for Delta sector
+        cell_name = DataUtils.parse_cell_name(nr_node_value)
+        if cell_name:
+            return cell_name.node_band
         
         return None
     
@@ -177,7 +185,7 @@ class Feature5:
     
     def validate_mapped_data(self, var_name, mapped):
         """Validate that all critical placeholders have values"""
-        print(f"      🔍 Validating {var_name}...")
+        logger.debug("      🔍 Validating %s...", var_name)
         
         missing = []
         none_values = []
@@ -189,25 +197,34 @@ class Feature5:
                 none_values.append(placeholder)
         
         if missing:
-            print(f"      ⚠️  Missing placeholders: {len(missing)}")
+            logger.debug("      ⚠️  Missing placeholders: %s", len(missing))
             for m in missing[:5]:  # Show first 5
-                print(f"         - {m}")
+                logger.debug("         - %s", m)
         
         if none_values:
-            print(f"      ⚠️  Placeholders with None values: {len(none_values)}")
+            logger.debug("      ⚠️  Placeholders with None values: %s", len(none_values))
             for n in none_values[:5]:  # Show first 5
-                print(f"         - {n}")
+                logger.debug("         - %s", n)
         
         if not missing and not none_values:
-            print(f"      ✅ All {len(mapped)} placeholders validated")
+            logger.debug("      ✅ All %s placeholders validated", len(mapped))
         
         return len(missing) == 0 and len(none_values) == 0
     
+    def get_output_name(self, var_name, var_data):
+        """
+        Name of the mapped variable (and its output file)
+        
+        Site partitions are named per site, e.g. NCRN002376_N066_1; other
+        groups by their band+carrier pattern, e.g. N066_1.
+        """
+        return var_data.get("partition_name") or var_data.get("band_carrier_pattern", var_name)
+    
     def map_variable(self, var_name, var_data):
         """Map a single populated variable to placeholder format"""
-        print(f"🔄 Mapping {var_name}...")
+        logger.debug("🔄 Mapping %s...", var_name)
         
-        mapped = {}
+        mapped = self.schema.new_record()
         
         # Get rows array
         rows = var_data.get("rows", [])
@@ -336,49 +353,50 @@ class Feature5:
         # Validate
         self.validate_mapped_data(var_name, mapped)
         
-        print(f"   ✅ Mapped {len(mapped)} placeholder parameters")
+        logger.debug("   ✅ Mapped %s placeholder parameters", len(mapped))
         
         return mapped
     
     def display_summary(self):
-        """Display mapping summary"""
-        print()
-        print("=" * 80)
-        print("📊 MAPPING SUMMARY")
-        print("=" * 80)
-        print()
+        """Display mapping summary (verbose only)"""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        
+        logger.debug("")
+        logger.debug("=" * 80)
+        logger.debug("📊 MAPPING SUMMARY")
+        logger.debug("=" * 80)
+        logger.debug("")
         
         for var_name, data in self.mapped_variables.items():
-            print(f"🔹 {var_name}:")
-            print(f"   Total placeholders: {len(data)}")
-            print()
+            logger.debug("🔹 %s:", var_name)
+            logger.debug("   Total placeholders: %s", len(data))
+            logger.debug("")
     
     def execute(self):
         """Execute Feature 5: Placeholder Mapping"""
         try:
-            print("🔍 Step 1: Analyzing populated variables")
-            print("-" * 80)
-            print(f"Total variables to map: {len(self.populated_variables)}")
-            print()
+            logger.info("🔍 Step 1: Analyzing populated variables")
+            logger.info("-" * 80)
+            logger.info("Total variables to map: %s", len(self.populated_variables))
+            logger.info("")
             
-            print("🔄 Step 2: Creating mapped variables")
-            print("-" * 80)
-            print()
+            logger.info("🔄 Step 2: Creating mapped variables")
+            logger.info("-" * 80)
+            logger.info("")
             
             for var_name, var_data in self.populated_variables.items():
-                new_var_name = var_data.get("band_carrier_pattern", var_name)
-                print(f"   Creating '{new_var_name}' from {var_name}...")
+                new_var_name = self.get_output_name(var_name, var_data)
+                logger.debug("   Creating '%s' from %s...", new_var_name, var_name)
                 self.mapped_variables[new_var_name] = self.map_variable(var_name, var_data)
             
-            print()
-            print(f"✅ Successfully mapped {len(self.mapped_variables)} variable(s)")
+            logger.info("")
+            logger.info("✅ Successfully mapped %s variable(s)", len(self.mapped_variables))
             
             self.display_summary()
             
             return self.mapped_variables
             
         except Exception as e:
-            print(f"❌ Error in Feature 5: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Error in Feature 5: %s", str(e))
             raise
@@ -7,52 +7,72 @@
 #==============================================================================
 
 import os
-import re
+from log_config import get_logger
+from template_engine import PlaceholderRecord, compile_template, template_registry
+
+logger = get_logger(__name__)
 
 class Feature6:
     """Feature 6: Template Generation with Dynamic Selection"""
     
+    # standard.txt = 4-Sector (Delta)
+    # stand.txt = 3-Sector (No Delta)
+    TEMPLATES_FOLDER = "templates"
+    TEMPLATE_FILES = {
+        "4_sector": "standard.txt",
+        "3_sector": "stand.txt"
+    }
+    
     def __init__(self, config, mapped_variables):
         """Initialize Feature 6"""
         self.config = config
         self.mapped_variables = mapped_variables
-        self.templates_folder = "templates"
-        self.output_folder = "output_templates"
+        self.templates_folder = self.TEMPLATES_FOLDER
+        self.output_folder = config.output_folder
+        self.write_output_files = config.write_output_files
         self.generated_files = []
+        self.listeners = []
         
         # Define paths for both templates
-        # standard.txt = 4-Sector (Delta)
-        # stand.txt = 3-Sector (No Delta)
         self.template_paths = {
-            "4_sector": os.path.join(self.templates_folder, "standard.txt"),
-            "3_sector": os.path.join(self.templates_folder, "stand.txt")
+            key: os.path.join(self.templates_folder, file_name)
+            for key, file_name in self.TEMPLATE_FILES.items()
         }
         self.loaded_templates = {}
     
+    def add_listener(self, callback):
+        """
+        Subscribe to per-file completion events
+        
+        Args:
+            callback: Called with each file's result dict as soon as the
+                file has been rendered (and written, if enabled)
+        """
+        self.listeners.append(callback)
+    
     def ensure_folders_exist(self):
         """Ensure templates and output folders exist"""
         if not os.path.exists(self.templates_folder):
             os.makedirs(self.templates_folder)
-            print(f"   ⚠️  Created '{self.templates_folder}' folder")
+            logger.warning("   ⚠️  Created '%s' folder", self.templates_folder)
         
-        if not os.path.exists(self.output_folder):
+        if self.write_output_files and not os.path.exists(self.output_folder):
             os.makedirs(self.output_folder)
-            print(f"   ✅ Created '{self.output_folder}' folder")
+            logger.info("   ✅ Created '%s' folder", self.output_folder)
     
     def read_templates(self):
-        """Read both template files into memory"""
-        print("      Loading templates...")
+        """Read both template files (served from the process-wide registry)"""
+        logger.info("      Loading templates...")
         
         for key, path in self.template_paths.items():
             try:
                 if os.path.exists(path):
-                    with open(path, 'r', encoding='utf-8') as f:
-                        self.loaded_templates[key] = f.read()
-                    print(f"      ✅ Loaded '{os.path.basename(path)}' ({key})")
+                    self.loaded_templates[key] = template_registry.get(path)
+                    logger.info("      ✅ Loaded '%s' (%s)", os.path.basename(path), key)
                 else:
-                    print(f"      ⚠️  Template not found: {path}")
+                    logger.warning("      ⚠️  Template not found: %s", path)
             except Exception as e:
-                print(f"      ❌ Error reading {path}: {str(e)}")
+                logger.error("      ❌ Error reading %s: %s", path, str(e))
 
         if not self.loaded_templates:
             raise FileNotFoundError("No templates could be loaded from templates/ folder")
@@ -60,32 +80,17 @@ class Feature6:
     def replace_placeholders_with_regex(self, template_content, variable_data):
         """
         Replace placeholders using REGEX for EXACT matching
-        Sorted by length (longest first) to prevent partial replacements
-        """
-        replaced_content = template_content
-        replacement_count = 0
-        
-        # Sort by length (longest first)
-        sorted_placeholders = sorted(
-            variable_data.items(),
-            key=lambda x: len(x[0]),
-            reverse=True
-        )
+        Longest placeholder wins at each position to prevent partial replacements
         
-        for placeholder, value in sorted_placeholders:
-            # Convert value to string (handle None)
-            value_str = str(value) if value is not None else ""
-            
-            # Use regex with escaped pattern for exact matching
-            pattern = re.escape(placeholder)
-            
-            # Perform replacement
-            # Only replace if the placeholder actually exists in the specific template
-            if re.search(pattern, replaced_content):
-                replaced_content = re.sub(pattern, value_str, replaced_content)
-                replacement_count += 1
+        The template is compiled once per placeholder set into literal segments
+        and slots, so each file is rendered in a single pass.
+        
+        Returns:
+            tuple: (replaced content, number of distinct placeholders replaced)
+        """
+        compiled = compile_template(template_content, variable_data.keys())
         
-        return replaced_content, replacement_count
+        return compiled.render(variable_data), compiled.replacement_count
     
     def detect_template_type(self, variable_data):
         """
@@ -112,104 +117,133 @@ class Feature6:
         else:
             return "3_sector", "stand.txt"
 
+    def render_variable(self, template_key, variable_data):
+        """
+        Render a loaded template with a variable's placeholder values
+        
+        Returns:
+            tuple: (replaced content, number of distinct placeholders replaced)
+        """
+        # Feature 5 records share one precomputed placeholder set and are
+        # rendered by slot position
+        placeholders = variable_data.keys()
+        if isinstance(variable_data, PlaceholderRecord):
+            placeholders = variable_data.schema.name_set
+        
+        compiled = template_registry.compile(
+            self.template_paths[template_key],
+            placeholders
+        )
+        
+        return compiled.render(variable_data), compiled.replacement_count
+    
+    def get_output_filename(self, variable_name):
+        """Name of the output file for a variable"""
+        return f"{variable_name}_output.txt"
+    
+    def encode_output(self, content):
+        """Encode rendered text exactly as a text-mode file write would"""
+        return content.replace("\n", os.linesep).encode('utf-8')
+    
     def generate_output_file(self, variable_name, content):
-        """Generate output file with replaced content"""
-        output_filename = f"{variable_name}_output.txt"
-        output_path = os.path.join(self.output_folder, output_filename)
+        """Write encoded output to the output folder (opt-in persistence)"""
+        output_path = os.path.join(self.output_folder, self.get_output_filename(variable_name))
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with open(output_path, 'wb') as f:
                 f.write(content)
             return output_path
         except Exception as e:
-            print(f"      ❌ Error writing output file: {str(e)}")
+            logger.error("      ❌ Error writing output file: %s", str(e))
             return None
     
     def process_variable(self, variable_name, variable_data):
         """Process a single variable"""
-        print(f"\n   📌 Processing '{variable_name}'...")
+        logger.debug("\n   📌 Processing '%s'...", variable_name)
         
         # 1. Determine which template to use
         template_key, template_filename = self.detect_template_type(variable_data)
         
         # 2. Get template content
         if template_key not in self.loaded_templates:
-             print(f"      ❌ Template '{template_filename}' required but not loaded. Skipping.")
+             logger.error("      ❌ Template '%s' required but not loaded. Skipping.", template_filename)
              return None
              
-        template_content = self.loaded_templates[template_key]
-        print(f"      ✅ Detected {template_key.replace('_', ' ').title()} -> Using '{template_filename}'")
+        logger.debug("      ✅ Detected %s -> Using '%s'", template_key.replace('_', ' ').title(), template_filename)
         
-        # 3. Replace placeholders
-        replaced_content, replacement_count = self.replace_placeholders_with_regex(
-            template_content,
-            variable_data
-        )
+        # 3. Replace placeholders (template compiled once per process)
+        replaced_content, replacement_count = self.render_variable(template_key, variable_data)
         
-        # 4. Generate output
-        output_path = self.generate_output_file(variable_name, replaced_content)
+        # 4. Generate output (kept in memory; written to disk only if enabled)
+        content = self.encode_output(replaced_content)
+        output_path = None
+        
+        if self.write_output_files:
+            output_path = self.generate_output_file(variable_name, content)
+        
+        result = {
+            "variable_name": variable_name,
+            "template_used": template_filename,
+            "file_name": self.get_output_filename(variable_name),
+            "content": content,
+            "output_file": output_path,
+            "replacements": replacement_count
+        }
         
-        if output_path:
-            return {
-                "variable_name": variable_name,
-                "template_used": template_filename,
-                "output_file": output_path,
-                "replacements": replacement_count
-            }
+        for listener in self.listeners:
+            listener(result)
         
-        return None
+        return result
     
     def display_summary(self):
         """Display generation summary"""
-        print("\n" + "=" * 80)
-        print("📊 GENERATION SUMMARY")
-        print("=" * 80 + "\n")
+        logger.info("\n" + "=" * 80)
+        logger.info("📊 GENERATION SUMMARY")
+        logger.info("=" * 80 + "\n")
         
         if self.generated_files:
-            print(f"✅ Successfully generated {len(self.generated_files)} file(s):\n")
+            logger.info("✅ Successfully generated %s file(s)\n", len(self.generated_files))
             
             for file_info in self.generated_files:
-                print(f"🔹 {file_info['variable_name']}:")
-                print(f"   Template: {file_info['template_used']}")
-                print(f"   Output: {file_info['output_file']}")
-                print(f"   Replacements: {file_info['replacements']}")
-                print()
+                logger.debug("🔹 %s:", file_info['variable_name'])
+                logger.debug("   Template: %s", file_info['template_used'])
+                logger.debug("   Output: %s", file_info['output_file'] or file_info['file_name'] + ' (in memory)')
+                logger.debug("   Replacements: %s", file_info['replacements'])
+                logger.debug("")
         else:
-            print("⚠️  No files were generated")
-            print()
+            logger.warning("⚠️  No files were generated")
+            logger.info("")
     
     def execute(self):
         """Execute Feature 6: Template Generation"""
         try:
-            print("🔍 Step 1: Setting up folders")
-            print("-" * 80)
+            logger.info("🔍 Step 1: Setting up folders")
+            logger.info("-" * 80)
             self.ensure_folders_exist()
-            print()
+            logger.info("")
             
-            print("📋 Step 2: Loading templates")
-            print("-" * 80)
+            logger.info("📋 Step 2: Loading templates")
+            logger.info("-" * 80)
             self.read_templates()
-            print()
+            logger.info("")
             
-            print("🔄 Step 3: Generating output files")
-            print("-" * 80)
-            print(f"   Processing {len(self.mapped_variables)} variable(s)...")
+            logger.info("🔄 Step 3: Generating output files")
+            logger.info("-" * 80)
+            logger.info("   Processing %s variable(s)...", len(self.mapped_variables))
             
             for var_name, var_data in self.mapped_variables.items():
                 result = self.process_variable(var_name, var_data)
                 if result:
                     self.generated_files.append(result)
             
-            print()
-            print("=" * 80)
-            print(f"✅ Generation complete: {len(self.generated_files)}/{len(self.mapped_variables)} successful")
+            logger.info("")
+            logger.info("=" * 80)
+            logger.info("✅ Generation complete: %s/%s successful", len(self.generated_files), len(self.mapped_variables))
             
             self.display_summary()
             
             return self.generated_files
             
         except Exception as e:
-            print(f"\n❌ Error in Feature 6: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("\n❌ Error in Feature 6: %s", str(e))
             raise
@@ -0,0 +1,244 @@
+#==============================================================================
+# STAGE INSTRUMENTATION
+#==============================================================================
+# Description: Per-feature wall time, row/group counts and peak memory,
+#              with per-method sub-step timings
+# Brand: MASTEC
+# Developer: AKSHATHA KALLUR
+#==============================================================================
+
+import functools
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from log_config import get_logger
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = get_logger(__name__)
+
+# tracemalloc is process-wide; concurrent runs share one tracing session
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+
+
+def _start_memory_tracing():
+    """Start tracemalloc for one more user"""
+    global _tracing_users
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        _tracing_users += 1
+
+
+def peak_rss_mb():
+    """
+    Process-wide resident memory high-water mark
+    
+    Returns:
+        float: Megabytes, or None where the platform does not report it
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def _stop_memory_tracing():
+    """Release one user; tracing stops when the last one leaves"""
+    global _tracing_users
+    with _tracing_lock:
+        _tracing_users -= 1
+        if _tracing_users == 0 and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+def _round(value, digits):
+    """Round a figure that may be missing"""
+    return None if value is None else round(value, digits)
+
+
+class StageTimer:
+    """Collect timing, volume and memory figures for every pipeline stage"""
+    
+    def __init__(self, track_memory=False):
+        """
+        Initialize the timer
+        
+        The process peak RSS is always recorded. It is cheap but only ever
+        grows, so a stage shows a rise only if it set a new high.
+        
+        Args:
+            track_memory: Also record each stage's own peak Python allocation
+                (tracemalloc). This is precise but makes allocation-heavy
+                stages several times slower. The figures cover every thread,
+                so concurrent runs overlap.
+        """
+        self.track_memory = track_memory
+        self.stages = []
+        self.current = None
+        self.started_at = time.time()
+        self.total_seconds = 0.0
+    
+    @contextmanager
+    def run(self):
+        """Time a whole pipeline run and manage memory tracing around it"""
+        if self.track_memory:
+            _start_memory_tracing()
+        start_time = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.total_seconds = time.perf_counter() - start_time
+            if self.track_memory:
+                _stop_memory_tracing()
+    
+    @contextmanager
+    def stage(self, number, name):
+        """
+        Time one stage; set rows/groups on the yielded record while it runs
+        
+        Args:
+            number: Stage number (0 for work outside Features 1-6)
+            name: Stage name
+        """
+        record = {
+            "stage": number,
+            "name": name,
+            "seconds": 0.0,
+            "rows": None,
+            "groups": None,
+            "peak_rss_mb": None,
+            "peak_traced_mb": None,
+            "steps": {}
+        }
+        self.stages.append(record)
+        self.current = record
+        
+        memory_base = None
+        if self.track_memory and tracemalloc.is_tracing():
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            memory_base = tracemalloc.get_traced_memory()[0]
+        
+        start_time = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = time.perf_counter() - start_time
+            record["peak_rss_mb"] = peak_rss_mb()
+            if memory_base is not None and tracemalloc.is_tracing():
+                peak = tracemalloc.get_traced_memory()[1]
+                record["peak_traced_mb"] = max(peak - memory_base, 0) / (1024 * 1024)
+            self.current = None
+    
+    def add_step(self, name, seconds, calls=1):
+        """Accumulate calls of a sub-step into the current stage"""
+        if self.current is None:
+            return
+        step = self.current["steps"].get(name)
+        if step is None:
+            step = {"calls": 0, "seconds": 0.0}
+            self.current["steps"][name] = step
+        step["calls"] += calls
+        step["seconds"] += seconds
+    
+    def instrument(self, obj, method_names):
+        """
+        Time selected methods of an object as sub-steps of the current stage
+        
+        Only this instance is affected; calls made through self.<method>
+        inside the object are timed too.
+        
+        Args:
+            obj: Feature instance
+            method_names: Names of methods to time
+        
+        Returns:
+            object: The same instance, for chaining
+        """
+        for name in method_names:
+            method = getattr(obj, name, None)
+            if method is None:
+                continue
+            setattr(obj, name, self._timed(name, method))
+        return obj
+    
+    def _timed(self, name, method):
+        """Wrap a bound method so each call is added to the current stage"""
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            start_time = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.add_step(name, time.perf_counter() - start_time)
+        return wrapper
+    
+    def table_rows(self):
+        """
+        Flatten stages and their sub-steps into table rows
+        
+        Returns:
+            list: One dict per stage followed by its sub-steps
+        """
+        rows = []
+        for record in self.stages:
+            rows.append({
+                "Stage": f"{record['stage']}. {record['name']}" if record["stage"] else record["name"],
+                "Calls": 1,
+                "Seconds": round(record["seconds"], 4),
+                "Rows": record["rows"],
+                "Groups": record["groups"],
+                "Peak RSS (MB)": _round(record["peak_rss_mb"], 1),
+                "Stage Peak (MB)": _round(record["peak_traced_mb"], 2)
+            })
+            for step_name, step in record["steps"].items():
+                rows.append({
+                    "Stage": f"    ↳ {step_name}",
+                    "Calls": step["calls"],
+                    "Seconds": round(step["seconds"], 4),
+                    "Rows": None,
+                    "Groups": None,
+                    "Peak RSS (MB)": None,
+                    "Stage Peak (MB)": None
+                })
+        return rows
+    
+    def to_dict(self):
+        """Timings as plain data"""
+        return {
+            "started_at": self.started_at,
+            "total_seconds": self.total_seconds,
+            "memory_tracked": self.track_memory,
+            "stages": self.stages
+        }
+    
+    def to_json(self):
+        """Timings as a JSON document"""
+        return json.dumps(self.to_dict(), indent=2)
+    
+    def print_summary(self):
+        """Write the stage table to the log"""
+        logger.info("⏱️  STAGE TIMINGS")
+        for record in self.stages:
+            details = [f"{record['seconds']:.3f}s"]
+            if record["rows"] is not None:
+                details.append(f"{record['rows']} rows")
+            if record["groups"] is not None:
+                details.append(f"{record['groups']} groups")
+            if record["peak_traced_mb"] is not None:
+                details.append(f"stage peak {record['peak_traced_mb']:.1f} MB")
+            if record["peak_rss_mb"] is not None:
+                details.append(f"process peak {record['peak_rss_mb']:.0f} MB")
+            logger.info("   %s. %s: %s", record['stage'], record['name'], ', '.join(details))
+        logger.info("   Total: %.3fs", self.total_seconds)
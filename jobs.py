@@ -0,0 +1,270 @@
+#==============================================================================
+# BACKGROUND JOBS
+#==============================================================================
+# Description: Run processing jobs off the Streamlit script thread and
+#              expose their progress for polling
+# Brand: MASTEC
+# Developer: AKSHATHA KALLUR
+#==============================================================================
+
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from config import Config
+from log_capture import RunLog
+
+class Job:
+    """A single background processing job and its live progress"""
+    
+    def __init__(self, total_stages, log_buffer_lines=2000, log_spill_dir=None):
+        """
+        Initialize the job
+        
+        Args:
+            total_stages: Number of pipeline stages reported through start_stage
+            log_buffer_lines: Log lines kept in memory for the live view
+            log_spill_dir: Folder for the full-log file (system temp if None)
+        """
+        self.id = uuid.uuid4().hex
+        self.status = "queued"
+        self.total_stages = total_stages
+        self.stage_number = 0
+        self.stage_name = None
+        # Feature the group in flight is in, within a streaming stage
+        self.feature_number = None
+        self.feature_name = None
+        self.groups_done = 0
+        self.groups_total = 0
+        # First and latest group updates of the current stage, for the ETA
+        self.groups_first_at = None
+        self.groups_first_done = 0
+        self.groups_last_at = None
+        self.log = RunLog(log_buffer_lines, log_spill_dir)
+        # Files published one by one as they are rendered
+        self.files = []
+        self.first_file_at = None
+        self.last_file_at = None
+        self.result = None
+        self.timings = None
+        self.error = None
+        self.workspace = None
+        self.submitted_at = time.time()
+        self.finished_at = None
+    
+    def start_stage(self, number, name):
+        """Record that a pipeline stage has started"""
+        self.stage_number = number
+        self.stage_name = name
+        self.feature_number = None
+        self.feature_name = None
+        self.groups_done = 0
+        self.groups_total = 0
+        self.groups_first_at = None
+        self.groups_first_done = 0
+        self.groups_last_at = None
+    
+    def start_feature(self, number, name):
+        """Record the feature the group in flight has reached"""
+        self.feature_number = number
+        self.feature_name = name
+    
+    def update_groups(self, done, total):
+        """Record group progress within the current stage"""
+        now = time.time()
+        if self.groups_first_at is None:
+            self.groups_first_at = now
+            self.groups_first_done = done
+        self.groups_last_at = now
+        self.groups_done = done
+        self.groups_total = total
+    
+    def add_file(self, file_info):
+        """Publish a rendered file (called from the job thread per file)"""
+        now = time.time()
+        if self.first_file_at is None:
+            self.first_file_at = now
+        self.last_file_at = now
+        self.files.append(file_info)
+    
+    def file_rate(self):
+        """
+        Rendering speed, from the per-file events
+        
+        Returns:
+            float: Files per second, or None until there are enough events
+        """
+        file_count = len(self.files)
+        if file_count < 2 or self.last_file_at <= self.first_file_at:
+            return None
+        return (file_count - 1) / (self.last_file_at - self.first_file_at)
+    
+    def eta_seconds(self):
+        """
+        Time left in the current stage, from the groups done per second
+        
+        Groups that match no template produce no file and partition
+        batches report many groups at once, so the group counter is used
+        rather than the file events.
+        
+        Returns:
+            float: Seconds remaining, or None until there are enough
+                group updates to estimate it
+        """
+        if not self.groups_total or self.groups_first_at is None:
+            return None
+        if self.groups_last_at <= self.groups_first_at:
+            return None
+        
+        groups_per_second = (self.groups_done - self.groups_first_done) / (self.groups_last_at - self.groups_first_at)
+        if groups_per_second <= 0:
+            return None
+        return max(self.groups_total - self.groups_done, 0) / groups_per_second
+    
+    @property
+    def finished(self):
+        """True once the job has completed or failed"""
+        return self.status in ("done", "failed")
+    
+    @property
+    def fraction(self):
+        """Overall completion between 0.0 and 1.0"""
+        if self.status == "done":
+            return 1.0
+        if self.stage_number == 0:
+            return 0.0
+        
+        stage_fraction = 0.0
+        if self.groups_total:
+            stage_fraction = self.groups_done / self.groups_total
+        return min((self.stage_number - 1 + stage_fraction) / self.total_stages, 1.0)
+    
+    def describe(self):
+        """Short human-readable progress line"""
+        if self.status == "queued":
+            return "Waiting for a free worker..."
+        if self.status == "done":
+            return "Completed"
+        if self.status == "failed":
+            return "Failed"
+        
+        text = f"Stage {self.stage_number}/{self.total_stages}: {self.stage_name}"
+        if self.feature_name:
+            text += f" - Feature {self.feature_number}: {self.feature_name}"
+        if self.groups_total:
+            text += f" ({self.groups_done}/{self.groups_total} groups)"
+        return text
+
+
+class JobRunner:
+    """Thread pool that runs jobs and keeps them addressable by ID"""
+    
+    def __init__(self, max_workers, retention_seconds, log_buffer_lines=2000, log_spill_dir=None):
+        """
+        Initialize the runner
+        
+        Args:
+            max_workers: Jobs allowed to run at the same time
+            retention_seconds: How long finished jobs stay retrievable
+            log_buffer_lines: Log lines each job keeps in memory
+            log_spill_dir: Folder for full-log files (system temp if None)
+        """
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dss-job")
+        self.retention_seconds = retention_seconds
+        self.log_buffer_lines = log_buffer_lines
+        self.log_spill_dir = log_spill_dir
+        self.jobs = {}
+        self.lock = threading.Lock()
+        # Started with the first job; prunes even when no page is polling
+        self.pruner = None
+    
+    def submit(self, function, *args, total_stages=6):
+        """
+        Start function(*args, job=job) in the background
+        
+        Args:
+            function: Callable doing the work; its return value becomes job.result
+            *args: Positional arguments for function
+            total_stages: Number of stages the job will report
+        
+        Returns:
+            Job: The submitted job
+        """
+        self.prune()
+        
+        job = Job(total_stages, self.log_buffer_lines, self.log_spill_dir)
+        with self.lock:
+            self.jobs[job.id] = job
+            if self.pruner is None:
+                self.pruner = threading.Thread(target=self._prune_periodically, name="dss-job-pruner", daemon=True)
+                self.pruner.start()
+        
+        self.executor.submit(self._run, job, function, args)
+        return job
+    
+    def _run(self, job, function, args):
+        """Execute a job and record its outcome"""
+        job.status = "running"
+        try:
+            result = function(*args, job=job)
+        except Exception as e:
+            job.error = f"{str(e)}\n{traceback.format_exc()}"
+            job.finished_at = time.time()
+            job.status = "failed"
+        else:
+            job.result = result
+            job.finished_at = time.time()
+            job.status = "done"
+        finally:
+            # The full log stays readable until the job is pruned
+            job.log.close(delete=False)
+    
+    def get(self, job_id):
+        """
+        Look up a job
+        
+        Args:
+            job_id: ID returned by submit
+        
+        Returns:
+            Job: The job, or None if unknown or already pruned
+        """
+        self.prune()
+        
+        if not job_id:
+            return None
+        with self.lock:
+            return self.jobs.get(job_id)
+    
+    def _prune_periodically(self):
+        """Prune expired jobs in the background (daemon thread)"""
+        interval = min(max(self.retention_seconds / 2, 1), 60)
+        while True:
+            time.sleep(interval)
+            self.prune()
+    
+    def prune(self):
+        """Forget finished jobs older than the retention period"""
+        cutoff = time.time() - self.retention_seconds
+        with self.lock:
+            expired = [
+                job_id for job_id, job in self.jobs.items()
+                if job.finished and job.finished_at < cutoff
+            ]
+            for job_id in expired:
+                job = self.jobs.pop(job_id)
+                job.log.close()
+                if job.workspace is not None:
+                    job.workspace.cleanup()
+
+
+_default_config = Config()
+
+# Shared by every Streamlit session in this process
+job_runner = JobRunner(
+    max_workers=_default_config.max_concurrent_jobs,
+    retention_seconds=_default_config.job_retention_minutes * 60,
+    log_buffer_lines=_default_config.log_buffer_lines,
+    log_spill_dir=_default_config.log_spill_dir
+)
@@ -0,0 +1,190 @@
+#==============================================================================
+# LOG CAPTURE
+#==============================================================================
+# Description: Route print output to the log of the run that produced it
+# Brand: MASTEC
+# Developer: AKSHATHA KALLUR
+#==============================================================================
+
+import os
+import sys
+import tempfile
+import threading
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+def _remove_file(path):
+    """Delete a file if it still exists"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class RunLog:
+    """
+    Bounded in-memory log of one run that spills every line to a file
+    
+    Only the newest max_lines stay in memory for display; the complete log
+    is appended to a temporary file and read back on demand, so memory use
+    does not grow with the size of the workbook.
+    """
+    
+    def __init__(self, max_lines=2000, spill_dir=None):
+        """
+        Initialize the log
+        
+        Args:
+            max_lines: Lines kept in memory for the live view
+            spill_dir: Folder for the full-log file (system temp folder if None)
+        """
+        self.lines = deque(maxlen=max_lines)
+        self.total_lines = 0
+        self.lock = threading.Lock()
+        
+        fd, self.spill_path = tempfile.mkstemp(prefix="dss_run_", suffix=".log", dir=spill_dir)
+        self.spill_file = os.fdopen(fd, 'w', encoding='utf-8')
+        
+        # Removes the file when close() is called, when the log is garbage
+        # collected or at interpreter exit
+        self._finalizer = weakref.finalize(self, _remove_file, self.spill_path)
+    
+    def append(self, line):
+        """Add one line (same signature as list.append)"""
+        with self.lock:
+            self.lines.append(line)
+            self.total_lines += 1
+            if not self.spill_file.closed:
+                self.spill_file.write(line)
+                self.spill_file.write("\n")
+    
+    def __len__(self):
+        return self.total_lines
+    
+    def tail(self, count):
+        """
+        Newest lines of the log
+        
+        Args:
+            count: Maximum number of lines
+        
+        Returns:
+            list: Up to count lines, oldest first
+        """
+        if count <= 0:
+            return []
+        with self.lock:
+            if count >= len(self.lines):
+                return list(self.lines)
+            return list(self.lines)[-count:]
+    
+    def read_all(self):
+        """
+        Complete log as UTF-8 bytes (for download)
+        
+        Returns:
+            bytes: Every line appended so far
+        """
+        with self.lock:
+            if not self.spill_file.closed:
+                self.spill_file.flush()
+        
+        try:
+            with open(self.spill_path, 'rb') as f:
+                return f.read()
+        except OSError:
+            # File already removed: fall back to what is still in memory
+            return "\n".join(self.tail(len(self.lines))).encode('utf-8')
+    
+    def close(self, delete=True):
+        """
+        Stop spilling and optionally delete the full-log file
+        
+        Args:
+            delete: Remove the file (the in-memory tail stays available)
+        """
+        with self.lock:
+            if not self.spill_file.closed:
+                self.spill_file.close()
+        if delete:
+            self._finalizer()
+
+
+class StreamCapture:
+    """Capture print statements to display in log window"""
+    def __init__(self, log_messages):
+        # Anything with append(): a RunLog for UI jobs, or a plain list
+        self.logs = log_messages
+    
+    def write(self, text):
+        if text.strip():
+            timestamp = datetime.now().strftime("%H:%M:%S")
+            self.logs.append(f"[{timestamp}] {text.strip()}")
+    
+    def flush(self):
+        pass
+
+
+class ThreadRoutedStdout:
+    """
+    sys.stdout replacement that sends each thread's writes to its own target
+    
+    contextlib.redirect_stdout swaps the process-wide sys.stdout, so two runs
+    executing at the same time would capture each other's output. This
+    router is installed once and dispatches on the writing thread instead.
+    """
+    
+    def __init__(self, fallback):
+        """
+        Initialize the router
+        
+        Args:
+            fallback: Stream used by threads without a registered target
+        """
+        self.fallback = fallback
+        self.targets = {}
+    
+    def _target(self):
+        return self.targets.get(threading.get_ident(), self.fallback)
+    
+    def write(self, text):
+        return self._target().write(text)
+    
+    def flush(self):
+        self._target().flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.fallback, name)
+
+
+_router_lock = threading.Lock()
+
+def _install_router():
+    """Install the router as sys.stdout (once per process)"""
+    with _router_lock:
+        if not isinstance(sys.stdout, ThreadRoutedStdout):
+            sys.stdout = ThreadRoutedStdout(sys.stdout)
+        return sys.stdout
+
+
+@contextmanager
+def capture_thread_stdout(target):
+    """
+    Redirect print output of the current thread to target
+    
+    Args:
+        target: Object with write() and flush()
+    """
+    router = _install_router()
+    thread_id = threading.get_ident()
+    previous = router.targets.get(thread_id)
+    router.targets[thread_id] = target
+    try:
+        yield target
+    finally:
+        if previous is None:
+            router.targets.pop(thread_id, None)
+        else:
+            router.targets[thread_id] = previous
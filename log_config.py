@@ -0,0 +1,79 @@
+#==============================================================================
+# LOGGING
+#==============================================================================
+# Description: Leveled loggers for the features; detail lines are only
+#              formatted when Config.verbose is on
+# Brand: MASTEC
+# Developer: AKSHATHA KALLUR
+#==============================================================================
+#
+# Levels used by the features:
+#     INFO    step headers, counts and summaries (always shown)
+#     DEBUG   per-row / per-lookup / per-placeholder detail (verbose only)
+#     WARNING and ERROR for problems
+#
+# Pass values as arguments (logger.debug("Found %s", value)) rather than
+# f-strings, so disabled lines cost a level check and nothing else.
+#
+
+import logging
+import sys
+
+ROOT_LOGGER_NAME = "dss"
+
+
+class CurrentStdoutHandler(logging.Handler):
+    """
+    Write records to whatever sys.stdout is at emit time
+    
+    The Streamlit jobs route stdout per thread and the batch CLI redirects it
+    to a per-workbook file, so the stream must not be bound at creation.
+    """
+    
+    def emit(self, record):
+        try:
+            sys.stdout.write(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
+
+
+def _root_logger():
+    """Application root logger, with the stdout handler installed once"""
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    
+    if not any(isinstance(handler, CurrentStdoutHandler) for handler in root.handlers):
+        handler = CurrentStdoutHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        root.addHandler(handler)
+        # Keep feature output out of Streamlit's / the host's root handlers
+        root.propagate = False
+        root.setLevel(logging.INFO)
+    
+    return root
+
+
+def get_logger(name):
+    """
+    Get a logger under the application's root logger
+    
+    Args:
+        name: Module name, e.g. __name__
+    
+    Returns:
+        logging.Logger: Logger named dss.<name>
+    """
+    _root_logger()
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}")
+
+
+def configure_logging(verbose=False):
+    """
+    Set the log level for a run
+    
+    The level is process-wide, so concurrent runs share the most recently
+    requested verbosity.
+    
+    Args:
+        verbose: Show DEBUG detail lines
+    """
+    _root_logger().setLevel(logging.DEBUG if verbose else logging.INFO)
@@ -0,0 +1,39 @@
+#==============================================================================
+# OUTPUT BUNDLE
+#==============================================================================
+# Description: Build the "Download All" ZIP archive from generated files
+# Brand: MASTEC
+# Developer: AKSHATHA KALLUR
+#==============================================================================
+
+import io
+import zipfile
+
+def build_zip_bundle(generated_files, compression_level=6, chunk_size=1024 * 1024):
+    """
+    Build a ZIP archive of generated files in memory
+    
+    Each file is streamed into the archive in chunks, so the compressor never
+    needs a second full copy of a large output.
+    
+    Args:
+        generated_files: List of Feature6 results (file_name + content bytes)
+        compression_level: zlib level 0-9 (0 stores files uncompressed)
+        chunk_size: Bytes handed to the compressor per write
+    
+    Returns:
+        bytes: ZIP archive
+    """
+    zip_buffer = io.BytesIO()
+    compression = zipfile.ZIP_DEFLATED if compression_level > 0 else zipfile.ZIP_STORED
+    
+    with zipfile.ZipFile(
+        zip_buffer, 'w', compression, compresslevel=compression_level or None
+    ) as zip_file:
+        for file_info in generated_files:
+            content = memoryview(file_info['content'])
+            with zip_file.open(file_info['file_name'], 'w') as entry:
+                for start in range(0, len(content), chunk_size):
+                    entry.write(content[start:start + chunk_size])
+    
+    return zip_buffer.getvalue()
@@ -0,0 +1,173 @@
+#==============================================================================
+# SITE PARTITIONS
+#==============================================================================
+# Description: Run Feature 3 → Feature 6 on batches of (gNB, band+carrier
+#              pattern) partitions across a process pool
+# Brand: MASTEC
+# Developer: AKSHATHA KALLUR
+#==============================================================================
+
+import contextlib
+import io
+import itertools
+import multiprocessing
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from instrumentation import StageTimer
+from log_config import configure_logging, get_logger
+from streaming import GroupStream
+
+logger = get_logger(__name__)
+
+# Set once per worker process by _init_worker
+_worker_state = {}
+
+
+def split_partitions(dss_variables, batch_size):
+    """
+    Split Feature 2 partitions into batches, keeping their order
+    
+    Args:
+        dss_variables: (variable name, variable data) pairs; consumed lazily
+        batch_size: Partitions per batch
+    
+    Yields:
+        dict: At most batch_size partitions
+    """
+    iterator = iter(dss_variables)
+    batch_size = max(1, batch_size)
+    while True:
+        batch = dict(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def process_partition_batch(config, dss_variables, indexes):
+    """
+    Stream one batch of partitions through Features 3-6
+    
+    Every partition is independent, so batches can run in any process.
+    
+    Args:
+        config: Config object with application settings
+        dss_variables: Batch of partitions from Feature 2
+        indexes: Feature 4 lookup indexes built by the parent
+    
+    Returns:
+        dict: files (Feature 6 results) and steps (per-method timings)
+    """
+    timer = StageTimer()
+    with timer.stage(3, "Partition Batch") as record:
+        group_stream = GroupStream(config, indexes=indexes).instrument(timer)
+        group_stream.prepare()
+        generated_files = list(group_stream.run(dss_variables.items(), len(dss_variables)))
+    
+    return {"files": generated_files, "steps": record["steps"]}
+
+
+def _init_worker(config, indexes):
+    """Keep the run settings and indexes for every batch this worker gets"""
+    _worker_state["config"] = config
+    _worker_state["indexes"] = indexes
+    configure_logging(config.verbose)
+
+
+def _partition_batch_job(dss_variables):
+    """Process one batch in a worker; its log is returned to the parent"""
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        result = process_partition_batch(
+            _worker_state["config"],
+            dss_variables,
+            _worker_state["indexes"]
+        )
+    result["log"] = log.getvalue()
+    return result
+
+
+def run_partitions(config, dss_variables, total, indexes, progress=None, timer=None, on_file=None):
+    """
+    Fan site partitions out across config.partition_workers processes
+    
+    Args:
+        config: Config object with application settings
+        dss_variables: (variable name, variable data) pairs from Feature 2
+        total: Number of partitions
+        indexes: Feature 4 lookup indexes (mixed_mode_index, eutran_index)
+        progress: Optional callback(partitions_done, partitions_total)
+        timer: Optional StageTimer; per-method timings are added to its
+            current stage (summed over workers, so they can exceed wall time)
+        on_file: Optional callback(file_info), called for each file as its
+            batch comes back
+    
+    Only about two batches per worker are pickled and in flight at a time;
+    the rest are cut from dss_variables as earlier batches finish.
+    
+    Returns:
+        list: Generated file results in partition order
+    """
+    batch_size = max(1, config.partitions_per_task)
+    batch_count = -(-total // batch_size)
+    batches = split_partitions(dss_variables, batch_size)
+    workers = max(1, min(config.partition_workers, batch_count))
+    results = [None] * batch_count
+    partitions_done = 0
+    
+    logger.info("📦 %s partition(s) in %s batch(es), %s worker(s)", total, batch_count, workers)
+    logger.info("")
+    
+    def collect(index, partitions, result):
+        nonlocal partitions_done
+        results[index] = result
+        partitions_done += partitions
+        
+        if result.get("log"):
+            sys.stdout.write(result["log"])
+        if timer is not None:
+            for name, step in result["steps"].items():
+                timer.add_step(name, step["seconds"], step["calls"])
+        if progress:
+            progress(partitions_done, total)
+        if on_file is not None:
+            for file_info in result["files"]:
+                on_file(file_info)
+        
+        logger.info("✅ Batch %s/%s: %s file(s)", index + 1, batch_count, len(result["files"]))
+    
+    executor = None
+    if workers > 1:
+        try:
+            # spawn: forking a threaded server process is not safe
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(config, indexes)
+            )
+        except Exception as e:
+            logger.warning("⚠️  Partition workers unavailable, processing in-process: %s", str(e))
+    
+    if executor is None:
+        for index, batch in enumerate(batches):
+            collect(index, len(batch), process_partition_batch(config, batch, indexes))
+    else:
+        with executor:
+            pending = {}
+            queued = enumerate(batches)
+            for index, batch in itertools.islice(queued, 2 * workers):
+                pending[executor.submit(_partition_batch_job, batch)] = (index, len(batch))
+            
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(*pending.pop(future), future.result())
+                
+                # Top the window back up as batches finish
+                for index, batch in itertools.islice(queued, len(done)):
+                    pending[executor.submit(_partition_batch_job, batch)] = (index, len(batch))
+    
+    generated_files = []
+    for result in results:
+        generated_files.extend(result["files"])
+    return generated_files
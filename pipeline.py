@@ -0,0 +1,271 @@
+#==============================================================================
+# DSS PIPELINE
+#==============================================================================
+# Description: Run Feature 1 → Feature 6 on one workbook (UI and jobs)
+# Brand: MASTEC
+# Developer: AKSHATHA KALLUR
+#==============================================================================
+
+import os
+from config import Config
+from feature1 import Feature1
+from feature2 import Feature2
+from feature6 import Feature6
+from instrumentation import StageTimer
+from log_capture import RunLog, StreamCapture, capture_thread_stdout
+from log_config import configure_logging, get_logger
+from partitioning import run_partitions
+from result_cache import PipelineResultCache
+from streaming import GroupStream
+from workbook import WorkbookSession
+from workspace import RunWorkspace
+
+logger = get_logger(__name__)
+
+# (number, name) of every stage, in execution order
+PIPELINE_STAGES = [
+    (1, "DSS Value Extraction"),
+    (2, "NRCellDU Grouping"),
+    (3, "Group Streaming (Features 3-6)")
+]
+
+# Methods timed as sub-steps of each stage
+STAGE_STEPS = {
+    1: ["read_worksheet", "filter_dss_rows"],
+    2: ["analyze_nrcelldu_values", "create_groups"]
+}
+# Features 3-6 stream each group in stage 3; their steps are listed in
+# streaming.STREAM_STEPS
+
+# Stage 3 name when Config.partition_by_site fans groups out to workers
+PARTITION_STAGE_NAME = "Site Partitions (Features 3-6)"
+
+
+def run_pipeline(config, progress=None, timer=None, on_file=None):
+    """
+    Process the workbook at config.excel_file_path through all features
+    
+    Args:
+        config: Config object with the Excel file path set
+        progress: Optional tracker with start_stage(number, name),
+            start_feature(number, name) and update_groups(done, total),
+            e.g. a background Job
+        timer: Optional StageTimer receiving per-stage timings; one is
+            created (and its table logged) if not given
+        on_file: Optional callback(file_info) called as each file is
+            rendered, e.g. Job.add_file
+    
+    Returns:
+        list: Generated file results from Feature 6, or None if no DSS rows
+    """
+    # Detail lines are only formatted when Config.verbose is on
+    configure_logging(config.verbose)
+    
+    if timer is None:
+        timer = StageTimer(track_memory=config.stage_memory_tracking)
+    
+    with timer.run():
+        generated_files = _run_stages(config, progress, timer, on_file)
+    
+    logger.info("")
+    timer.print_summary()
+    return generated_files
+
+
+def _run_stages(config, progress, timer, on_file):
+    """Run the cache lookup and Features 1-6 under a StageTimer"""
+    def stage(number, name=None):
+        name = name or PIPELINE_STAGES[number - 1][1]
+        if progress is not None:
+            progress.start_stage(number, name)
+        logger.info("🔵 FEATURE %s: %s", number, name)
+        return timer.stage(number, name)
+    
+    def finish_stage(number):
+        logger.info("✅ Feature %s Complete", number)
+        logger.info("")
+    
+    def instrument(feature, number):
+        return timer.instrument(feature, STAGE_STEPS[number])
+    
+    update_groups = progress.update_groups if progress is not None else None
+    start_feature = progress.start_feature if progress is not None else None
+    
+    # Same workbook, templates and settings as an earlier run: reuse its files
+    result_cache = None
+    cache_key = None
+    if config.result_cache_enabled:
+        with timer.stage(0, "Result Cache Lookup") as record:
+            result_cache = PipelineResultCache(config)
+            cache_key = result_cache.make_key()
+            cached_files = result_cache.get(cache_key)
+            if cached_files is not None:
+                record["groups"] = len(cached_files)
+        
+        if cached_files is not None:
+            logger.info("⚡ Cache hit: reusing %s generated file(s) from an earlier run", len(cached_files))
+            if config.write_output_files:
+                restore_output_files(config, cached_files)
+            if on_file is not None:
+                for file_info in cached_files:
+                    on_file(file_info)
+            return cached_files
+        logger.info("🔍 Cache miss: processing workbook")
+        logger.info("")
+    
+    # Open the workbook once; every feature shares its parsed sheets
+    with WorkbookSession(config) as session:
+        if result_cache is not None:
+            session.file_hash = result_cache.file_hash
+        
+        # Parse the independent worksheets concurrently up front
+        session.preload(config.pipeline_worksheets)
+        
+        # Feature 1: DSS Extraction
+        with stage(1) as record:
+            feature1 = instrument(Feature1(config, session), 1)
+            filtered_df = feature1.execute()
+            if filtered_df is not None:
+                record["rows"] = len(filtered_df)
+        
+        if filtered_df is None or len(filtered_df) == 0:
+            logger.warning("⚠️ No DSS values found")
+            return None
+        
+        finish_stage(1)
+        
+        # Feature 2: NRCellDU Grouping (variables are built as they stream)
+        with stage(2) as record:
+            feature2 = instrument(Feature2(config, filtered_df), 2)
+            dss_variables = feature2.stream()
+            group_count = len(feature2.groups)
+            record["rows"] = len(filtered_df)
+            record["groups"] = group_count
+        finish_stage(2)
+        
+        if config.partition_by_site:
+            # Site partitions: Features 3-6 per batch in a worker pool
+            with stage(3, PARTITION_STAGE_NAME) as record:
+                # Lookup indexes are built once and shared with the workers
+                group_stream = GroupStream(config, session).instrument(timer)
+                group_stream.prepare()
+                generated_files = run_partitions(
+                    config,
+                    dss_variables,
+                    group_count,
+                    group_stream.feature4.get_indexes(),
+                    progress=update_groups,
+                    timer=timer,
+                    on_file=on_file
+                )
+                record["groups"] = len(generated_files)
+        else:
+            # Features 3-6: each group is cleaned, populated, mapped and
+            # rendered before the next one starts
+            with stage(3) as record:
+                group_stream = GroupStream(config, session, on_feature=start_feature).instrument(timer)
+                if on_file is not None:
+                    group_stream.feature6.add_listener(on_file)
+                group_stream.prepare()
+                generated_files = list(group_stream.run(dss_variables, group_count, update_groups))
+                record["groups"] = len(generated_files)
+        logger.info("✅ Features 3-6 Complete")
+        logger.info("")
+        
+        logger.info("🎉 All processing complete!")
+    
+    if result_cache is not None and generated_files:
+        result_cache.put(cache_key, generated_files)
+    
+    return generated_files
+
+
+def restore_output_files(config, generated_files):
+    """
+    Write cached results to config.output_folder
+    
+    Args:
+        config: Config object with the output folder set
+        generated_files: Cached Feature 6 results; output_file is filled in
+    """
+    feature6 = Feature6(config, {})
+    feature6.ensure_folders_exist()
+    for file_info in generated_files:
+        file_info["output_file"] = feature6.generate_output_file(
+            file_info["variable_name"],
+            file_info["content"]
+        )
+
+
+def process_excel_file(file_bytes, file_name, session_id=None, job=None, timer=None, config=None):
+    """
+    Process an uploaded Excel file through all features
+    
+    This is the Streamlit upload path. It runs as a background job, so it
+    must not touch st.* because it executes outside the Streamlit script
+    thread. Logs and progress go to the job.
+    
+    Args:
+        file_bytes: Uploaded workbook content
+        file_name: Uploaded file name
+        session_id: Owning UI session (names the workspace)
+        job: Job receiving log lines and per-stage progress
+        timer: Optional StageTimer; one is created (and attached to the
+            job) if not given
+        config: Optional Config to start from (default: Config())
+        
+    Returns:
+        list: Generated file results, or None on failure
+    """
+    # Every run gets a private workspace so concurrent users never share
+    # the upload or output files; the job cleans it up when it expires
+    workspace = RunWorkspace(session_id)
+    if job is not None:
+        job.workspace = workspace
+    
+    # Initialize config
+    if config is None:
+        config = Config()
+    config.output_folder = workspace.output_dir
+    
+    # Capture all log output (per thread, so jobs do not mix) into a
+    # bounded log that spills the full text to disk
+    if job is not None:
+        run_log = job.log
+    else:
+        run_log = RunLog(config.log_buffer_lines, config.log_spill_dir)
+    stream_capture = StreamCapture(run_log)
+    
+    # Per-stage timings, shown as a table once the job finishes
+    if timer is None:
+        timer = StageTimer(track_memory=config.stage_memory_tracking)
+    if job is not None:
+        job.timings = timer
+    
+    with capture_thread_stdout(stream_capture):
+        try:
+            # Save uploaded file into the run workspace
+            config.excel_file_path = workspace.save_upload(file_bytes, file_name)
+            
+            # Each file is published to the job as soon as it is rendered
+            on_file = job.add_file if job is not None else None
+            generated_files = run_pipeline(config, progress=job, timer=timer, on_file=on_file)
+            
+            if config.write_output_files:
+                timings_path = os.path.join(config.output_folder, config.stage_timings_file)
+                with open(timings_path, 'w', encoding='utf-8') as f:
+                    f.write(timer.to_json())
+            
+            return generated_files
+            
+        except Exception as e:
+            logger.exception("❌ Error: %s", str(e))
+            return None
+        
+        finally:
+            # Clean up: outputs live in memory unless persistence is enabled
+            workspace.remove_upload()
+            if not config.write_output_files:
+                workspace.cleanup()
+            if job is None:
+                run_log.close()
@@ -0,0 +1,106 @@
+#==============================================================================
+# PIPELINE RESULT CACHE
+#==============================================================================
+# Description: Reuse generated files when the same workbook is processed
+#              again with the same templates and settings
+# Brand: MASTEC
+# Developer: AKSHATHA KALLUR
+#==============================================================================
+
+import os
+from disk_cache import DiskCache
+from feature6 import Feature6
+from log_config import get_logger
+
+logger = get_logger(__name__)
+
+class PipelineResultCache:
+    """Disk cache of Feature 6 results keyed by everything that shapes them"""
+    
+    # Bump when a feature change alters the generated output
+    RESULT_VERSION = "1"
+    
+    # Config attributes that influence the generated files
+    CONFIG_FIELDS = [
+        "target_worksheet",
+        "sheet_reader_mode",
+        "sheet_columns",
+        "dss_column_name",
+        "nrcelldu_column_name",
+        "dss_exclude_value",
+        "partition_by_site",
+        "site_column_name"
+    ]
+    
+    def __init__(self, config):
+        """
+        Initialize the result cache
+        
+        Args:
+            config: Config object with the Excel file path set
+        """
+        self.config = config
+        self.cache = DiskCache(
+            config.result_cache_dir,
+            config.result_cache_max_mb * 1024 * 1024
+        )
+        self.file_hash = None
+    
+    def template_hashes(self):
+        """SHA-256 of every template file Feature 6 may select"""
+        hashes = []
+        for key, file_name in sorted(Feature6.TEMPLATE_FILES.items()):
+            path = os.path.join(Feature6.TEMPLATES_FOLDER, file_name)
+            if os.path.exists(path):
+                hashes.append((key, DiskCache.hash_file(path)))
+            else:
+                hashes.append((key, None))
+        return hashes
+    
+    def make_key(self):
+        """
+        Build the cache key for the current upload
+        
+        Returns:
+            str: Cache key
+        """
+        if self.file_hash is None:
+            self.file_hash = DiskCache.hash_file(self.config.excel_file_path)
+        
+        return DiskCache.make_key(
+            "pipeline",
+            self.RESULT_VERSION,
+            self.file_hash,
+            self.template_hashes(),
+            [(field, getattr(self.config, field, None)) for field in self.CONFIG_FIELDS]
+        )
+    
+    def get(self, key):
+        """
+        Look up generated files for a key
+        
+        Args:
+            key: Cache key from make_key
+        
+        Returns:
+            list: Generated file results, or None on a miss
+        """
+        return self.cache.get(key)
+    
+    def put(self, key, generated_files):
+        """
+        Store generated files for a key
+        
+        Output paths are dropped because they point into a run workspace
+        that will not exist when the entry is reused.
+        
+        Args:
+            key: Cache key from make_key
+            generated_files: Feature 6 results
+        """
+        entries = [dict(file_info, output_file=None) for file_info in generated_files]
+        
+        try:
+            self.cache.put(key, entries)
+        except Exception as e:
+            logger.warning("⚠️  Could not cache results: %s", str(e))
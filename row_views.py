@@ -0,0 +1,154 @@
+#==============================================================================
+# ROW VIEWS
+#==============================================================================
+# Description: Read-only views of a group's rows in the filtered "5G Info"
+#              frame, so stages share one copy of the data
+# Brand: MASTEC
+# Developer: AKSHATHA KALLUR
+#==============================================================================
+
+from collections.abc import Mapping, Sequence
+
+
+class FrameColumns:
+    """Column values of one DataFrame, converted once and shared by every view"""
+    
+    def __init__(self, df):
+        """
+        Initialize the column store
+        
+        Args:
+            df: DataFrame the views index into (not copied)
+        """
+        self.df = df
+        self.names = list(df.columns)
+        self.values = {}
+    
+    @classmethod
+    def from_values(cls, values):
+        """Column store over plain column lists, e.g. one group's own values"""
+        columns = cls.__new__(cls)
+        columns.df = None
+        columns.names = list(values)
+        columns.values = dict(values)
+        return columns
+    
+    def column(self, name):
+        """
+        All values of a column as Python objects (converted on first use)
+        
+        Args:
+            name: Column name
+        
+        Returns:
+            list: One value per frame row, as DataFrame.to_dict('records') gives
+        """
+        values = self.values.get(name)
+        if values is None:
+            values = self.df[name].tolist()
+            self.values[name] = values
+        return values
+
+
+class RowView(Mapping):
+    """One row of a GroupRows view, read through the shared column store"""
+    
+    __slots__ = ("_frame", "_position", "_columns")
+    
+    def __init__(self, frame, position, columns):
+        self._frame = frame
+        self._position = position
+        self._columns = columns
+    
+    def __getitem__(self, key):
+        return self._frame.column(self._columns[key])[self._position]
+    
+    def __iter__(self):
+        return iter(self._columns)
+    
+    def __len__(self):
+        return len(self._columns)
+    
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class GroupRows(Sequence):
+    """
+    A group's rows as integer positions into the filtered frame
+    
+    Behaves like the former list of row dicts (len, indexing, iteration,
+    row.get(...)) without copying any row. Use column() to read one field
+    for the whole group and to_records() where real dicts are needed.
+    """
+    
+    __slots__ = ("frame", "positions", "columns")
+    
+    def __init__(self, frame, positions, columns=None):
+        """
+        Initialize the view
+        
+        Args:
+            frame: FrameColumns of the filtered frame
+            positions: Row positions of the group, in sheet order
+            columns: Optional {visible name: frame column}; all columns if None
+        """
+        self.frame = frame
+        self.positions = positions
+        if columns is None:
+            columns = {name: name for name in frame.names}
+        self.columns = columns
+    
+    def __len__(self):
+        return len(self.positions)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return GroupRows(self.frame, self.positions[index], self.columns)
+        return RowView(self.frame, self.positions[index], self.columns)
+    
+    def __reduce__(self):
+        # Pickle only this group's values (partition workers), not the frame
+        values = {name: self.column(name) for name in self.columns}
+        return (_group_rows_from_values, (values, len(self)))
+    
+    def column(self, name):
+        """
+        One field for every row of the group
+        
+        Args:
+            name: Visible column name
+        
+        Returns:
+            list: Values in row order
+        """
+        values = self.frame.column(self.columns[name])
+        return [values[position] for position in self.positions]
+    
+    def select(self, columns):
+        """
+        View of the same rows restricted to (and renamed to) some columns
+        
+        Args:
+            columns: {visible name: current visible name}
+        
+        Returns:
+            GroupRows: New view sharing the frame and positions
+        """
+        return GroupRows(
+            self.frame,
+            self.positions,
+            {name: self.columns[source] for name, source in columns.items()}
+        )
+    
+    def to_records(self):
+        """Materialize the rows as a list of dicts"""
+        return [dict(row) for row in self]
+    
+    def __repr__(self):
+        return f"GroupRows({len(self)} rows, {list(self.columns)})"
+
+
+def _group_rows_from_values(values, row_count):
+    """Rebuild a pickled GroupRows over its own column values"""
+    return GroupRows(FrameColumns.from_values(values), list(range(row_count)))
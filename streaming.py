@@ -0,0 +1,149 @@
+#==============================================================================
+# GROUP STREAMING
+#==============================================================================
+# Description: Carry each DSS group through Feature 3 → Feature 6 on its
+#              own, so output files are produced as groups complete
+# Brand: MASTEC
+# Developer: AKSHATHA KALLUR
+#==============================================================================
+
+from feature3 import Feature3
+from feature4 import Feature4
+from feature5 import Feature5
+from feature6 import Feature6
+from log_config import get_logger
+
+logger = get_logger(__name__)
+
+# Methods timed as sub-steps while groups stream through Features 3-6
+STREAM_STEPS = {
+    "feature3": ["transform_variable"],
+    "feature4": ["load_worksheets", "populate_variable"],
+    "feature5": ["map_variable"],
+    "feature6": ["read_templates", "render_variable", "encode_output", "generate_output_file"]
+}
+
+# Features a group passes through while it streams, reported to on_feature
+STREAM_FEATURES = {
+    3: "JSON Cleaning",
+    4: "Data Population",
+    5: "Placeholder Mapping",
+    6: "Template Generation"
+}
+
+
+class GroupStream:
+    """Clean, populate, map and render one DSS group at a time"""
+    
+    def __init__(self, config, session=None, indexes=None, on_feature=None):
+        """
+        Initialize the stream
+        
+        Args:
+            config: Config object with application settings
+            session: WorkbookSession Feature 4 reads its worksheets from
+            indexes: Optional Feature 4 lookup indexes built elsewhere
+                (partition workers), in place of reading the worksheets
+            on_feature: Optional callback(number, name) called as the group
+                in flight enters each of Features 3-6, e.g. Job.start_feature
+        """
+        self.config = config
+        self.on_feature = on_feature
+        self.feature3 = Feature3(config, {})
+        self.feature4 = Feature4(config, {}, session, indexes=indexes)
+        self.feature5 = Feature5(config, {})
+        self.feature6 = Feature6(config, {})
+        self.groups_done = 0
+        self.files_generated = 0
+        self.missing_ids = []
+    
+    def instrument(self, timer):
+        """
+        Time the per-group methods as sub-steps of the timer's current stage
+        
+        Returns:
+            GroupStream: The same stream, for chaining
+        """
+        for attribute, method_names in STREAM_STEPS.items():
+            timer.instrument(getattr(self, attribute), method_names)
+        return self
+    
+    def prepare(self):
+        """Build the Feature 4 lookup indexes and load the templates once"""
+        if not self.feature4.indexes_loaded:
+            self.feature4.load_worksheets()
+        self.feature6.ensure_folders_exist()
+        self.feature6.read_templates()
+        logger.info("")
+    
+    def process_group(self, var_name, var_data):
+        """
+        Run one DSS variable through Features 3-6
+        
+        Args:
+            var_name: Variable name (DSS1, DSS2, etc.)
+            var_data: Variable data from Feature 2
+        
+        Returns:
+            dict: Feature 6 result, or None if no template applied
+        """
+        self.enter_feature(3)
+        cleaned = self.feature3.transform_variable(var_name, var_data)
+        
+        self.enter_feature(4)
+        populated = self.feature4.populate_variable(var_name, cleaned)
+        if not self.feature4.has_sector_cell_ids(populated):
+            self.missing_ids.append(var_name)
+        
+        self.enter_feature(5)
+        output_name = self.feature5.get_output_name(var_name, populated)
+        mapped = self.feature5.map_variable(var_name, populated)
+        
+        self.enter_feature(6)
+        return self.feature6.process_variable(output_name, mapped)
+    
+    def enter_feature(self, number):
+        """Report that the group in flight has reached a feature"""
+        if self.on_feature is not None:
+            self.on_feature(number, STREAM_FEATURES[number])
+    
+    def run(self, dss_variables, total=None, progress=None):
+        """
+        Yield each generated file as soon as its group has been rendered
+        
+        Only the groups in flight are held in memory; the intermediate
+        cleaned / populated / mapped data of a finished group is dropped.
+        
+        Args:
+            dss_variables: (variable name, variable data) pairs, e.g.
+                Feature2.stream()
+            total: Number of groups, for progress reporting
+            progress: Optional callback(groups_done, groups_total)
+        
+        Yields:
+            dict: Feature 6 result for each group that produced a file
+        """
+        logger.info("🔄 Streaming %s group(s) through Features 3-6", total if total is not None else "all")
+        logger.info("-" * 80)
+        
+        try:
+            for var_name, var_data in dss_variables:
+                result = self.process_group(var_name, var_data)
+                self.groups_done += 1
+                if progress:
+                    progress(self.groups_done, total or self.groups_done)
+                if result:
+                    self.files_generated += 1
+                    yield result
+        except Exception as e:
+            logger.exception("❌ Error streaming groups: %s", str(e))
+            raise
+        
+        self.display_summary()
+    
+    def display_summary(self):
+        """Log the totals once every group has been processed"""
+        logger.info("✅ Populated %d variable(s)", self.groups_done)
+        if self.missing_ids:
+            logger.warning("⚠️  No sector/cell IDs found for: %s", ', '.join(self.missing_ids))
+        logger.info("✅ Generation complete: %s/%s successful", self.files_generated, self.groups_done)
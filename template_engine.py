@@ -0,0 +1,282 @@
+#==============================================================================
+# TEMPLATE ENGINE
+#==============================================================================
+# Description: Compile templates once into literal segments and placeholder
+#              slots, then render them with a single join
+# Brand: MASTEC
+# Developer: AKSHATHA KALLUR
+#==============================================================================
+
+import os
+import re
+import threading
+from collections.abc import Mapping
+
+class PlaceholderSchema:
+    """
+    Fixed, ordered list of placeholder names shared by mapped records
+    
+    One schema exists per distinct list (see placeholder_schema), so
+    compiled templates can resolve their slots to record positions once.
+    """
+    
+    __slots__ = ("names", "name_set", "positions")
+    
+    def __init__(self, names):
+        """
+        Initialize the schema
+        
+        Args:
+            names: Placeholder names, in record order
+        """
+        self.names = tuple(names)
+        self.name_set = frozenset(self.names)
+        self.positions = {name: position for position, name in enumerate(self.names)}
+    
+    def new_record(self):
+        """Empty record (every placeholder None)"""
+        return PlaceholderRecord(self)
+
+
+class PlaceholderRecord(Mapping):
+    """
+    One group's placeholder values, stored by schema position
+    
+    Reads like a dict of placeholder name → value, but holds only a list
+    the length of the schema.
+    """
+    
+    __slots__ = ("schema", "values")
+    
+    def __init__(self, schema, values=None):
+        """
+        Initialize the record
+        
+        Args:
+            schema: PlaceholderSchema giving the position of each name
+            values: Optional values in schema order (default: all None)
+        """
+        self.schema = schema
+        self.values = list(values) if values is not None else [None] * len(schema.names)
+    
+    def __getitem__(self, name):
+        return self.values[self.schema.positions[name]]
+    
+    def __setitem__(self, name, value):
+        self.values[self.schema.positions[name]] = value
+    
+    def __contains__(self, name):
+        return name in self.schema.positions
+    
+    def __iter__(self):
+        return iter(self.schema.names)
+    
+    def __len__(self):
+        return len(self.values)
+    
+    def __repr__(self):
+        return f"PlaceholderRecord({dict(self)!r})"
+
+
+_schemas = {}
+
+def placeholder_schema(names):
+    """
+    Get the shared schema for a list of placeholder names
+    
+    Args:
+        names: Placeholder names, in record order
+    
+    Returns:
+        PlaceholderSchema: The same object for every equal list
+    """
+    key = tuple(names)
+    schema = _schemas.get(key)
+    if schema is None:
+        schema = _schemas.setdefault(key, PlaceholderSchema(key))
+    return schema
+
+
+class CompiledTemplate:
+    """Template split into literal segments and placeholder slots"""
+    
+    def __init__(self, content, placeholders):
+        """
+        Compile a template for a set of placeholders
+        
+        Placeholders are matched in one left-to-right scan with a longest-first
+        alternation, so a placeholder that is a prefix of another one (e.g.
+        xxLTE_Site_IDxx vs xxLTE_Site_IDxx_XA_1) never splits the longer one.
+        
+        Args:
+            content: Template text
+            placeholders: Iterable of placeholder names
+        """
+        names = sorted({name for name in placeholders if name}, key=len, reverse=True)
+        
+        # literals has one more entry than slots: lit0 slot0 lit1 ... litN
+        self.literals = []
+        self.slots = []
+        
+        position = 0
+        if names:
+            pattern = re.compile("|".join(re.escape(name) for name in names))
+            for match in pattern.finditer(content):
+                self.literals.append(content[position:match.start()])
+                self.slots.append(match.group(0))
+                position = match.end()
+        self.literals.append(content[position:])
+        
+        self.used_placeholders = frozenset(self.slots)
+        # PlaceholderSchema → record position of every slot
+        self.slot_positions = {}
+    
+    @property
+    def replacement_count(self):
+        """Number of distinct placeholders present in the template"""
+        return len(self.used_placeholders)
+    
+    def render(self, variable_data):
+        """
+        Render the template with placeholder values
+        
+        Args:
+            variable_data: Mapping of placeholder name to value (None → "")
+        
+        Returns:
+            str: Rendered text
+        """
+        if isinstance(variable_data, PlaceholderRecord):
+            return self.render_record(variable_data)
+        
+        values = {}
+        for name in self.used_placeholders:
+            value = variable_data.get(name)
+            values[name] = str(value) if value is not None else ""
+        
+        parts = [None] * (len(self.literals) + len(self.slots))
+        parts[0::2] = self.literals
+        parts[1::2] = [values[name] for name in self.slots]
+        return "".join(parts)
+    
+    def render_record(self, record):
+        """
+        Render from a PlaceholderRecord by slot position
+        
+        The slot → position table is built once per schema, so a file costs
+        one str() per value and a join, with no name lookups.
+        
+        Args:
+            record: PlaceholderRecord whose schema covers every slot
+        
+        Returns:
+            str: Rendered text
+        """
+        positions = self.slot_positions.get(record.schema)
+        if positions is None:
+            positions = [record.schema.positions[name] for name in self.slots]
+            self.slot_positions[record.schema] = positions
+        
+        texts = [str(value) if value is not None else "" for value in record.values]
+        
+        parts = [None] * (len(self.literals) + len(self.slots))
+        parts[0::2] = self.literals
+        parts[1::2] = [texts[position] for position in positions]
+        return "".join(parts)
+
+
+# Small per-process memo; stale template versions are dropped wholesale
+MAX_COMPILED_TEMPLATES = 32
+_compiled_templates = {}
+
+def compile_template(content, placeholders):
+    """
+    Get a compiled template, compiling it on first use
+    
+    Args:
+        content: Template text
+        placeholders: Iterable of placeholder names
+    
+    Returns:
+        CompiledTemplate: Compiled template for this content and placeholder set
+    """
+    key = (content, frozenset(placeholders))
+    compiled = _compiled_templates.get(key)
+    if compiled is None:
+        if len(_compiled_templates) >= MAX_COMPILED_TEMPLATES:
+            _compiled_templates.clear()
+        compiled = CompiledTemplate(content, key[1])
+        _compiled_templates[key] = compiled
+    return compiled
+
+
+class TemplateRegistry:
+    """
+    Process-wide cache of template files and their compiled forms
+    
+    Files are read once per process and revalidated by mtime and size on
+    every access, so edits on disk are picked up on the next run without
+    re-reading unchanged templates. Streamlit keeps imported modules alive
+    across reruns and sessions, so all of them share this cache.
+    """
+    
+    def __init__(self):
+        """Initialize an empty registry"""
+        self.entries = {}
+        self.lock = threading.Lock()
+    
+    def _entry(self, path):
+        """Get the cache entry for a path, (re)loading it if the file changed"""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry is not None and entry["signature"] == signature:
+                return entry
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        entry = {"signature": signature, "content": content, "compiled": {}}
+        with self.lock:
+            self.entries[path] = entry
+        return entry
+    
+    def get(self, path):
+        """
+        Get a template's text
+        
+        Args:
+            path: Template file path
+            
+        Returns:
+            str: Template content
+        """
+        return self._entry(path)["content"]
+    
+    def compile(self, path, placeholders):
+        """
+        Get a template compiled for a placeholder set
+        
+        Args:
+            path: Template file path
+            placeholders: Iterable of placeholder names
+            
+        Returns:
+            CompiledTemplate: Compiled template for the current file version
+        """
+        entry = self._entry(path)
+        key = frozenset(placeholders)
+        
+        compiled = entry["compiled"].get(key)
+        if compiled is None:
+            compiled = CompiledTemplate(entry["content"], key)
+            with self.lock:
+                entry["compiled"][key] = compiled
+        return compiled
+
+
+# Shared by every Feature6 instance in this process
+template_registry = TemplateRegistry()
@@ -0,0 +1,12 @@
+#==============================================================================
+# TEST CONFIGURATION
+#==============================================================================
+# Description: Make the flat application modules importable from tests/
+# Brand: MASTEC
+# Developer: AKSHATHA KALLUR
+#==============================================================================
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
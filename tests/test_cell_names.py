@@ -0,0 +1,69 @@
+#==============================================================================
+# CELL NAME PARSING TESTS
+#==============================================================================
+# Description: Cell names with underscore site prefixes or trailing fields
+#              keep the sector, essSc and node keys the stages extracted
+# Brand: MASTEC
+# Developer: AKSHATHA KALLUR
+#==============================================================================
+
+import pandas as pd
+import pytest
+from config import Config
+from feature3 import Feature3
+from feature5 import Feature5
+from utils import DataUtils
+
+
+@pytest.fixture
+def feature3():
+    return Feature3(Config(), {})
+
+
+@pytest.fixture
+def feature5():
+    return Feature5(Config(), {})
+
+
+@pytest.mark.parametrize("value, sector", [
+    ("WCL03194_9A_1", "A"),
+    ("NCGN003194_N002A_1", "A"),
+    ("WCL_03194_9C_1", "C"),
+    ("NC_RN002376_N066D_1", "D"),
+    ("NCRN002376_N066B_1_OLD", "B"),
+    ("NCRN002376", None),
+    (None, None),
+])
+def test_extract_sector(feature3, value, sector):
+    assert feature3.extract_sector(value) == sector
+
+
+@pytest.mark.parametrize("value, pattern, node", [
+    ("NCRN002376_N066A_1", "N066A_1", "NCRN002376_N066"),
+    ("NC_RN002376_N066D_1", "N066D_1", "NC_RN002376_N066"),
+    ("WCL_03194_N066B_2", "N066B_2", "WCL_03194_N066"),
+    # The essSc / node keys only apply when the name ends with the carrier
+    ("NCRN002376_N066A_1_OLD", None, None),
+    ("NCRN002376_N066A_1_", None, None),
+    ("NCRN002376_N066E_1", None, None),
+    ("_N066A_1", "N066A_1", None),
+])
+def test_nr_keys(feature5, value, pattern, node):
+    assert feature5.extract_pattern_from_nr_value(value) == pattern
+    assert feature5.extract_n00x_from_nr_node(value) == node
+
+
+def test_ess_sc_values_for_underscore_site(feature5):
+    assert feature5.get_ess_sc_values("NC_RN002376_N066A_1") == {"essScPairId": 2222, "essScLocalId": 20}
+
+
+@pytest.mark.parametrize("value, pattern", [
+    ("NCRN002376_N066A_1", "N066_1"),
+    ("NCRN002376_N066B_2_OLD", "N066_2"),
+    # Feature 2 groups on the first three fields only
+    ("NC_RN002376_N066D_1", "UNKNOWN"),
+    ("WCL03194_9A_1", "UNKNOWN"),
+])
+def test_band_carrier_pattern(value, pattern):
+    assert DataUtils.extract_band_carrier_pattern(value) == pattern
+    assert DataUtils.extract_band_carrier_patterns(pd.Series([value])).tolist() == [pattern]
@@ -7,8 +7,73 @@
 
 #==============================================================================
 
+import logging
 import pandas as pd
 import re
+from collections import namedtuple
+from functools import lru_cache
+from log_config import get_logger
+
+# <site>_<band><sector>_<carrier>, e.g. NCRN002376_N066A_1 or WCL03194_9A_1
+# Read from the right, so site prefixes may contain underscores (WCL_03194_9C_1)
+CELL_NAME_REGEX = re.compile(r'^(.*)_([A-Z]?\d+)([A-Z])_([^_]*)$')
+# Fallback for names with fields after the carrier (NCRN002376_N066A_1_X)
+CELL_NAME_PREFIX_REGEX = re.compile(r'^(.*?)_([A-Z]?\d+)([A-Z])_([^_]*)(_.*)$')
+# Feature 2 grouping: <site>_<band>[<sector>]_<carrier>, first three fields only
+BAND_CARRIER_REGEX = re.compile(r'^[^_]*_([A-Z]\d+)[A-Z]?_([^_]*)')
+NR_BAND_REGEX = re.compile(r'^N\d{3}$')
+
+logger = get_logger(__name__)
+
+
+class CellName(namedtuple('CellName', ['site', 'band', 'sector', 'carrier', 'suffix'])):
+    """
+    NRCellDU / EUtranCell name decomposed into its parts
+    
+    Example:
+        NCRN002376_N066A_1 → site='NCRN002376', band='N066', sector='A', carrier='1', suffix=''
+        WCL_03194_9C_1 → site='WCL_03194', band='9', sector='C', carrier='1', suffix=''
+        NCRN002376_N066A_1_X → site='NCRN002376', band='N066', sector='A', carrier='1', suffix='_X'
+    """
+    __slots__ = ()
+    
+    @property
+    def is_nr_sector_cell(self):
+        """True for NR cells ending in e.g. N066A_1 (N + 3 digits, sector A-D, 1-digit carrier)"""
+        return (
+            not self.suffix
+            and NR_BAND_REGEX.match(self.band) is not None
+            and self.sector in ('A', 'B', 'C', 'D')
+            and len(self.carrier) == 1
+            and self.carrier.isdigit()
+        )
+    
+    @property
+    def sector_carrier(self):
+        """Band+sector+carrier key (e.g. "N066A_1") for NR sector cells"""
+        if self.is_nr_sector_cell:
+            return f"{self.band}{self.sector}_{self.carrier}"
+        return None
+    
+    @property
+    def node_band(self):
+        """Site+band prefix (e.g. "NCRN002376_N066") for NR sector cells"""
+        if self.is_nr_sector_cell and self.site:
+            return f"{self.site}_{self.band}"
+        return None
+
+
+@lru_cache(maxsize=65536)
+def _parse_cell_name(name):
+    """Parse a stripped cell name string (memoized)"""
+    match = CELL_NAME_REGEX.match(name)
+    if match:
+        return CellName(*match.groups(), '')
+    
+    match = CELL_NAME_PREFIX_REGEX.match(name)
+    if match:
+        return CellName(*match.groups())
+    return None
 
 class DataUtils:
     """Utility class for data processing operations"""
@@ -71,26 +136,46 @@ class DataUtils:
         if pd.isna(nrcelldu):
             return "UNKNOWN"
         
-        nrcelldu_str = str(nrcelldu).strip()
+        match = BAND_CARRIER_REGEX.match(str(nrcelldu).strip())
+        if match:
+            return f"{match.group(1)}_{match.group(2)}"
         
-        # Split by underscore
-        parts = nrcelldu_str.split('_')
+        return "UNKNOWN"
+    
+    @staticmethod
+    def parse_cell_name(value):
+        """
+        Decompose an NRCellDU / EUtranCell name into a CellName record
         
-        if len(parts) < 3:
-            return "UNKNOWN"
+        Results are memoized, so every stage that looks at the same name
+        shares a single parse.
         
-        # Get the middle part (e.g., N066A) and last part (e.g., 1)
-        middle_part = parts[1]  # N066A
-        carrier_num = parts[2]   # 1
+        Args:
+            value: Cell name (any type; NaN/None are accepted)
+            
+        Returns:
+            CellName: Parsed record, or None if the name does not match
+        """
+        if value is None or (not isinstance(value, str) and pd.isna(value)):
+            return None
         
-        # Remove the sector letter (A, B, C, etc.) from the middle part
-        # Pattern: N066A → N066
-        band_match = re.match(r'^([A-Z]\d+)[A-Z]?$', middle_part)
-        if band_match:
-            band = band_match.group(1)  # N066
-            return f"{band}_{carrier_num}"
+        return _parse_cell_name(str(value).strip())
+    
+    @staticmethod
+    def extract_band_carrier_patterns(nrcelldu_series):
+        """
+        Vectorized extract_band_carrier_pattern for a whole column
         
-        return "UNKNOWN"
+        Args:
+            nrcelldu_series: pandas Series of NRCellDU values
+            
+        Returns:
+            Series: Band+carrier patterns ("UNKNOWN" where no match)
+        """
+        values = nrcelldu_series.astype(str).str.strip()
+        parts = values.str.extract(BAND_CARRIER_REGEX)
+        patterns = parts[0] + "_" + parts[1]
+        return patterns.fillna("UNKNOWN")
     
     @staticmethod
     def display_dataframe_summary(df, columns, title="Data Summary"):
@@ -102,12 +187,16 @@ class DataUtils:
             columns: List of columns to display
             title: Title for the summary
         """
-        print(f"📋 {title}:")
-        print("-" * 80)
+        # Rendering the table is the expensive part; skip it unless verbose
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        
+        logger.debug("📋 %s:", title)
+        logger.debug("-" * 80)
         display_cols = [col for col in columns if col in df.columns]
         if display_cols:
-            print(df[display_cols].to_string(index=False))
-        print()
-        print("-" * 80)
-        print()
+            logger.debug(df[display_cols].to_string(index=False))
+        logger.debug("")
+        logger.debug("-" * 80)
+        logger.debug("")
 
@@ -0,0 +1,350 @@
+#==============================================================================
+# WORKBOOK SESSION
+#==============================================================================
+# Description: Open the uploaded workbook once and share parsed worksheets
+# Brand: MASTEC
+# Developer: AKSHATHA KALLUR
+#==============================================================================
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from openpyxl.cell.cell import ERROR_CODES
+from pandas.io.parsers import TextParser
+from disk_cache import DiskCache
+from log_config import get_logger
+from utils import DataUtils
+
+logger = get_logger(__name__)
+
+
+def _convert_value(value):
+    """Convert a raw openpyxl value the same way pandas' Excel reader does"""
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        int_value = int(value)
+        return int_value if int_value == value else value
+    if isinstance(value, str) and value in ERROR_CODES:
+        return np.nan
+    return value
+
+
+def read_projected_sheet(worksheet, columns):
+    """
+    Stream a worksheet and materialize only the requested columns
+    
+    Headers are taken from the first row and matched case-insensitively
+    (same rule as DataUtils.find_column_case_insensitive). Requested columns
+    that are missing are skipped; callers report them when they look them up.
+    
+    Args:
+        worksheet: openpyxl worksheet opened in read-only mode
+        columns: List of column names to keep
+    
+    Returns:
+        DataFrame: Projected worksheet data
+    """
+    # Read-only sheets may carry a stale dimension tag; scan the real extent
+    if hasattr(worksheet, "reset_dimensions"):
+        worksheet.reset_dimensions()
+    
+    rows = worksheet.iter_rows(values_only=True)
+    header = next(rows, None)
+    if header is None:
+        return pd.DataFrame()
+    
+    # Resolve each requested column to its first matching header position
+    wanted = {name.strip().upper() for name in columns}
+    positions = []
+    seen = set()
+    for position, name in enumerate(header):
+        if name is None:
+            continue
+        key = str(name).strip().upper()
+        if key in wanted and key not in seen:
+            seen.add(key)
+            positions.append(position)
+    
+    if not positions:
+        return pd.DataFrame()
+    
+    data = [[header[position] for position in positions]]
+    last_row_with_data = 0
+    for row in rows:
+        width = len(row)
+        values = [
+            _convert_value(row[position]) if position < width else ""
+            for position in positions
+        ]
+        data.append(values)
+        if any(value != "" for value in values):
+            last_row_with_data = len(data) - 1
+    
+    # Trim trailing empty rows, then let pandas infer dtypes and NA values
+    # exactly as pd.read_excel would
+    data = data[: last_row_with_data + 1]
+    return TextParser(data, header=0).read()
+
+
+def _load_sheet_job(config, target_sheet_name):
+    """Parse one worksheet in a worker process (the parent owns the cache)"""
+    with WorkbookSession(config) as session:
+        session.cache = None
+        return session.load_sheet(target_sheet_name)
+
+
+class WorkbookSession:
+    """Open an Excel workbook once and lazily parse/cache its worksheets"""
+    
+    def __init__(self, config):
+        """
+        Initialize the workbook session
+        
+        Args:
+            config: Config object with the Excel file path set
+        """
+        self.config = config
+        self.excel_file = None
+        self.sheets = {}
+        self.reader_mode = getattr(config, "sheet_reader_mode", "full")
+        self.sheet_columns = getattr(config, "sheet_columns", {})
+        self.file_hash = None
+        self.pending = {}
+        self.executor = None
+        
+        # Parsed sheets are cached on disk by upload hash + sheet name
+        self.cache = None
+        if getattr(config, "sheet_cache_enabled", False):
+            self.cache = DiskCache(
+                config.sheet_cache_dir,
+                config.sheet_cache_max_mb * 1024 * 1024
+            )
+    
+    def open(self):
+        """Open the workbook (only the first call touches the file)"""
+        if self.excel_file is None:
+            self.excel_file = pd.ExcelFile(self.config.excel_file_path)
+        return self.excel_file
+    
+    @property
+    def sheet_names(self):
+        """List of worksheet names in the workbook"""
+        return self.open().sheet_names
+    
+    def find_sheet(self, target_sheet_name):
+        """
+        Resolve a worksheet name case-insensitively
+        
+        Args:
+            target_sheet_name: Sheet name to search for
+        
+        Returns:
+            str: Actual sheet name if found, None otherwise
+        """
+        return DataUtils.find_worksheet_case_insensitive(self.open(), target_sheet_name)
+    
+    def get_projection(self, target_sheet_name):
+        """
+        Get the projected columns configured for a worksheet
+        
+        Args:
+            target_sheet_name: Sheet name (case-insensitive)
+        
+        Returns:
+            list: Column names to read, or None to read every column
+        """
+        if self.reader_mode != "projected":
+            return None
+        
+        for sheet, columns in self.sheet_columns.items():
+            if sheet.strip().upper() == target_sheet_name.strip().upper():
+                return columns
+        return None
+    
+    def parse_sheet(self, sheet_name, columns=None):
+        """
+        Parse a worksheet, streaming only the projected columns when possible
+        
+        Args:
+            sheet_name: Actual sheet name in the workbook
+            columns: Column names to keep (None parses every column)
+        
+        Returns:
+            DataFrame: Parsed worksheet
+        """
+        excel_file = self.open()
+        
+        # Projection needs openpyxl; legacy .xls files fall back to pandas
+        if columns and excel_file.engine == "openpyxl":
+            return read_projected_sheet(excel_file.book[sheet_name], columns)
+        
+        return excel_file.parse(sheet_name)
+    
+    def cache_key(self, target_sheet_name):
+        """
+        Build the disk cache key for a requested worksheet
+        
+        The key only depends on the uploaded bytes and the request, so a
+        repeat upload is served without opening the workbook at all.
+        
+        Args:
+            target_sheet_name: Sheet name (case-insensitive)
+            
+        Returns:
+            str: Cache key
+        """
+        if self.file_hash is None:
+            self.file_hash = DiskCache.hash_file(self.config.excel_file_path)
+        
+        return DiskCache.make_key(
+            "sheet",
+            self.file_hash,
+            target_sheet_name.strip().upper(),
+            self.get_projection(target_sheet_name)
+        )
+    
+    def load_sheet(self, target_sheet_name):
+        """
+        Resolve and parse a worksheet, going through the disk cache if enabled
+        
+        Args:
+            target_sheet_name: Sheet name (case-insensitive)
+            
+        Returns:
+            tuple: (actual sheet name, DataFrame) or (None, None) if missing
+        """
+        key = None
+        if self.cache is not None:
+            key = self.cache_key(target_sheet_name)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        sheet_name = self.find_sheet(target_sheet_name)
+        df = None
+        if sheet_name is not None:
+            df = self.parse_sheet(sheet_name, self.get_projection(target_sheet_name))
+        
+        if key is not None:
+            try:
+                self.cache.put(key, (sheet_name, df))
+            except OSError as e:
+                logger.warning("⚠️  Could not cache '%s': %s", target_sheet_name, str(e))
+        
+        return sheet_name, df
+    
+    def preload(self, target_sheet_names):
+        """
+        Start parsing worksheets concurrently in a process pool
+        
+        Each sheet is parsed by its own worker; get_sheet then waits on the
+        matching future instead of parsing. Cached sheets are not submitted,
+        and small workbooks are left to the regular lazy path because
+        starting workers would cost more than it saves.
+        
+        Args:
+            target_sheet_names: Sheet names (case-insensitive) to parse
+            
+        Returns:
+            dict: Pending futures keyed by normalized sheet name
+        """
+        if not getattr(self.config, "parallel_sheet_loading", False):
+            return self.pending
+        
+        file_mb = os.path.getsize(self.config.excel_file_path) / (1024 * 1024)
+        if file_mb < getattr(self.config, "parallel_sheet_min_mb", 0):
+            return self.pending
+        
+        for target_sheet_name in target_sheet_names:
+            key = target_sheet_name.strip().upper()
+            if key in self.sheets or key in self.pending:
+                continue
+            
+            if self.cache is not None:
+                cached = self.cache.get(self.cache_key(target_sheet_name))
+                if cached is not None:
+                    self.sheets[key] = cached
+                    continue
+            
+            try:
+                if self.executor is None:
+                    # spawn: forking a threaded server process is not safe
+                    self.executor = ProcessPoolExecutor(
+                        max_workers=min(len(target_sheet_names), self.config.sheet_loader_workers),
+                        mp_context=multiprocessing.get_context("spawn")
+                    )
+                self.pending[key] = self.executor.submit(
+                    _load_sheet_job, self.config, target_sheet_name
+                )
+            except Exception as e:
+                logger.warning("⚠️  Parallel sheet loading unavailable: %s", str(e))
+                break
+        
+        return self.pending
+    
+    def await_sheet(self, target_sheet_name):
+        """
+        Wait for a preloaded worksheet, parsing it inline if the worker failed
+        
+        Args:
+            target_sheet_name: Sheet name (case-insensitive)
+            
+        Returns:
+            tuple: (actual sheet name, DataFrame) or (None, None) if missing
+        """
+        future = self.pending.pop(target_sheet_name.strip().upper())
+        try:
+            result = future.result()
+        except Exception:
+            # Worker crashed or could not start; the inline parse reports
+            # real workbook errors the usual way
+            return self.load_sheet(target_sheet_name)
+        
+        if self.cache is not None:
+            try:
+                self.cache.put(self.cache_key(target_sheet_name), result)
+            except OSError as e:
+                logger.warning("⚠️  Could not cache '%s': %s", target_sheet_name, str(e))
+        
+        return result
+    
+    def get_sheet(self, target_sheet_name):
+        """
+        Get a worksheet as a DataFrame, parsing it on first access
+        
+        Args:
+            target_sheet_name: Sheet name (case-insensitive)
+        
+        Returns:
+            tuple: (actual sheet name, DataFrame) or (None, None) if missing
+        """
+        key = target_sheet_name.strip().upper()
+        
+        if key not in self.sheets:
+            if key in self.pending:
+                self.sheets[key] = self.await_sheet(target_sheet_name)
+            else:
+                self.sheets[key] = self.load_sheet(target_sheet_name)
+        
+        return self.sheets[key]
+    
+    def close(self):
+        """Release the workbook handle, worker pool and cached worksheets"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+        self.pending = {}
+        if self.excel_file is not None:
+            self.excel_file.close()
+            self.excel_file = None
+        self.sheets = {}
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
@@ -0,0 +1,74 @@
+#==============================================================================
+# RUN WORKSPACE
+#==============================================================================
+# Description: Private temporary folder per session/run for the uploaded
+#              workbook and generated files
+# Brand: MASTEC
+# Developer: AKSHATHA KALLUR
+#==============================================================================
+
+import os
+import shutil
+import tempfile
+import uuid
+import weakref
+
+class RunWorkspace:
+    """Isolated temporary workspace for a single processing run"""
+    
+    def __init__(self, session_id=None, root=None):
+        """
+        Create the workspace folder
+        
+        Args:
+            session_id: Identifier of the owning UI session (used in the name)
+            root: Parent folder (system temp folder if None)
+        """
+        self.run_id = uuid.uuid4().hex
+        prefix = f"dss_{session_id[:8]}_" if session_id else "dss_"
+        self.path = tempfile.mkdtemp(prefix=f"{prefix}{self.run_id[:8]}_", dir=root)
+        self.upload_path = None
+        self.output_dir = os.path.join(self.path, "output_templates")
+        
+        # Removes the folder when cleanup() is called, when the workspace is
+        # garbage collected (e.g. its session ends) or at interpreter exit
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self.path, ignore_errors=True)
+    
+    def save_upload(self, data, file_name="upload.xlsx"):
+        """
+        Write the uploaded workbook into the workspace
+        
+        Args:
+            data: Uploaded file bytes (or buffer)
+            file_name: Original file name; only its extension is kept
+        
+        Returns:
+            str: Path of the saved workbook
+        """
+        extension = os.path.splitext(file_name)[1].lower() or ".xlsx"
+        self.upload_path = os.path.join(self.path, f"upload{extension}")
+        with open(self.upload_path, "wb") as f:
+            f.write(data)
+        return self.upload_path
+    
+    def remove_upload(self):
+        """Delete the uploaded workbook once it is no longer needed"""
+        if self.upload_path and os.path.exists(self.upload_path):
+            os.remove(self.upload_path)
+        self.upload_path = None
+    
+    @property
+    def alive(self):
+        """True until the workspace has been cleaned up"""
+        return self._finalizer.alive
+    
+    def cleanup(self):
+        """Delete the workspace folder and everything in it"""
+        self._finalizer()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.cleanup()
+        return False